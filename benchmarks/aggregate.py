@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Capacity report: Python loop over Instance objects vs InstanceTable.aggregate().
+
+Usage:
+  python benchmarks/aggregate.py [count]
+
+Builds `count` instances from parsed synthetic API pages (see models_memory.py)
+and sums cores, vCPU and memory by zone and by platform.
+Requires NumPy.
+"""
+
+import os
+import sys
+import json
+import time
+
+from collections import defaultdict
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from models_memory import instance
+from yandex_cloud_client import Instance, InstanceTable
+from yandex_cloud_client.utils.request import Request
+
+ZONES = ('ru-central1-a', 'ru-central1-b', 'ru-central1-c')
+PLATFORMS = ('standard-v1', 'standard-v2', 'standard-v3')
+
+
+def payload(i):
+    data = instance(i)
+    data['zoneId'] = ZONES[i % len(ZONES)]
+    data['platformId'] = PLATFORMS[i // 7 % len(PLATFORMS)]
+    data['resources'] = {'memory': str((i % 8 + 1) * 2 ** 30), 'cores': str(i % 4 * 2 + 2),
+                         'coreFraction': str((20, 50, 100)[i % 3])}
+    return data
+
+
+def report(instances, by):
+    result = defaultdict(lambda: {'count': 0, 'cores': 0, 'vcpus': 0.0, 'memory': 0})
+    for obj in instances:
+        group = result[getattr(obj, by)]
+        group['count'] += 1
+        group['cores'] += obj.resources.cores
+        group['vcpus'] += obj.resources.cores * obj.resources.core_fraction / 100
+        group['memory'] += obj.resources.memory
+    return dict(result)
+
+
+def best(func, repeat=10):
+    result, times = None, []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+    return result, min(times) * 1000
+
+
+def main(count=100000):
+    request = Request()
+    pages = [request._parse(json.dumps({'instances': [payload(i) for i in range(start, min(start + 1000, count))]})
+                            .encode()).result['instances'] for start in range(0, count, 1000)]
+
+    instances = [obj for page in pages for obj in Instance.de_list(page, None)]
+    table = InstanceTable.from_pages(pages)
+    columns = ('cores', 'vcpus', 'memory')
+
+    print(f'{count} instances')
+    print(f'{"by":<14}{"loop, ms":>12}{"table, ms":>12}')
+    for by in ('zone_id', 'platform_id'):
+        expected, loop = best(lambda: report(instances, by))
+        # table[:] is a new table without the cached groups
+        result, bulk = best(lambda: table[:].aggregate(by=by, columns=columns))
+        for key, totals in expected.items():
+            assert result[key]['count'] == totals['count'] and result[key]['memory'] == totals['memory']
+            assert abs(result[key]['vcpus'] - totals['vcpus']) < 1e-6
+        print(f'{by:<14}{loop:>12.1f}{bulk:>12.1f}')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
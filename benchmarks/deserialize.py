@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""Deserialization speed of the models.
+
+Usage:
+  python benchmarks/deserialize.py [count] [repeat]
+
+Builds `count` instances, disks, snapshots and operations from parsed synthetic
+API payloads (see models_memory.py) and prints the best time of `repeat` runs.
+"""
+
+import os
+import sys
+import gc
+import json
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from models_memory import instance, disk, snapshot, operation
+from yandex_cloud_client import Instance, Disk, Snapshot, Operation
+from yandex_cloud_client.utils.request import Request
+
+
+def measure(model, factory, count, repeat):
+    payload = Request()._parse(json.dumps({'items': [factory(i) for i in range(count)]}).encode()).result['items']
+
+    best = float('inf')
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            model.de_list(payload, None)
+            best = min(best, time.perf_counter() - start)
+    finally:
+        gc.enable()
+    return best
+
+
+def main(count=10000, repeat=20):
+    print(f'{"model":<12}{"objects":>10}{"best, ms":>12}{"per object, us":>17}')
+    for model, factory in ((Instance, instance), (Disk, disk), (Snapshot, snapshot), (Operation, operation)):
+        best = measure(model, factory, count, repeat)
+        print(f'{model.__name__:<12}{count:>10}{best * 1000:>12.1f}{best / count * 10 ** 6:>17.2f}')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:3]))
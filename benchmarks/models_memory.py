@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Memory usage of the deserialized models.
+
+Usage:
+  python benchmarks/models_memory.py [count]
+
+Builds `count` instances, disks, snapshots and operations from synthetic API
+payloads and prints traced memory per object (payload dicts excluded).
+"""
+
+import sys
+import gc
+import json
+import tracemalloc
+
+from yandex_cloud_client import Instance, Disk, Snapshot, Operation
+from yandex_cloud_client.utils.request import Request
+
+
+def instance(i):
+    return {
+        'id': f'fhm{i:017d}', 'folderId': 'b1g00000000000000000', 'createdAt': '2020-10-31T10:00:00Z',
+        'name': f'instance-{i}', 'zoneId': 'ru-central1-a', 'platformId': 'standard-v2', 'status': 'RUNNING',
+        'labels': {'env': 'prod'}, 'fqdn': f'instance-{i}.ru-central1.internal',
+        'resources': {'memory': '2147483648', 'cores': '2', 'coreFraction': '20'},
+        'metadata': {'user-data': '#cloud-config', 'ssh-keys': 'user:ssh-ed25519 AAAA'},
+        'bootDisk': {'mode': 'READ_WRITE', 'deviceName': 'boot', 'autoDelete': True, 'diskId': f'epd{i:017d}'},
+        'networkInterfaces': [{'index': '0', 'macAddress': 'd0:0d:00:00:00:00', 'subnetId': 'e9b00000000000000000',
+                               'primaryV4Address': {'address': '10.0.0.1',
+                                                    'oneToOneNat': {'address': '1.1.1.1', 'ipVersion': 'IPV4'}}}],
+        'schedulingPolicy': {'preemptible': True}, 'networkSettings': {'type': 'STANDARD'},
+    }
+
+
+def disk(i):
+    return {
+        'id': f'epd{i:017d}', 'folderId': 'b1g00000000000000000', 'createdAt': '2020-10-31T10:00:00Z',
+        'name': f'disk-{i}', 'typeId': 'network-hdd', 'zoneId': 'ru-central1-a', 'size': '10737418240',
+        'productIds': ['f2e00000000000000000'], 'status': 'READY', 'instanceIds': [f'fhm{i:017d}'],
+    }
+
+
+def snapshot(i):
+    return {
+        'id': f'fd8{i:017d}', 'folderId': 'b1g00000000000000000', 'createdAt': '2020-10-31T10:00:00Z',
+        'name': f'snapshot-{i}', 'storageSize': '1073741824', 'diskSize': '10737418240', 'status': 'READY',
+        'sourceDiskId': f'epd{i:017d}', 'labels': {'creator': 'snapshotter'},
+    }
+
+
+def operation(i):
+    return {
+        'id': f'fhm{i:017d}', 'description': 'Stop instance', 'createdAt': '2020-10-31T10:00:00Z',
+        'createdBy': 'aje00000000000000000', 'modifiedAt': '2020-10-31T10:00:00Z', 'done': True,
+        'metadata': {'instanceId': f'fhm{i:017d}'},
+    }
+
+
+def measure(model, factory, count):
+    payload = Request()._parse(json.dumps({'items': [factory(i) for i in range(count)]}).encode()).result['items']
+
+    gc.collect()
+    tracemalloc.start()
+    objects = model.de_list(payload, None)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert len(objects) == count
+    return current
+
+
+def main(count=50000):
+    print(f'{"model":<12}{"objects":>10}{"total, MB":>12}{"per object, B":>16}')
+    for model, factory in ((Instance, instance), (Disk, disk), (Snapshot, snapshot), (Operation, operation)):
+        total = measure(model, factory, count)
+        print(f'{model.__name__:<12}{count:>10}{total / 2 ** 20:>12.1f}{total // count:>16}')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50000)
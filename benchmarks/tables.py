@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""Scan of a large disk listing: Disk objects vs DiskTable.
+
+Usage:
+  python benchmarks/tables.py [count]
+
+Builds `count` disks from parsed synthetic API pages (see models_memory.py)
+as objects and as DiskTable, then selects ids of big disks of one zone.
+Requires NumPy.
+"""
+
+import os
+import sys
+import gc
+import json
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from models_memory import disk
+from yandex_cloud_client import Disk, DiskTable
+from yandex_cloud_client.utils.request import Request
+
+ZONES = ('ru-central1-a', 'ru-central1-b', 'ru-central1-c')
+LIMIT = 50 * 2 ** 30
+
+
+def payload(i):
+    data = disk(i)
+    data['zoneId'] = ZONES[i % len(ZONES)]
+    data['size'] = str((i % 100 + 1) * 2 ** 30)
+    return data
+
+
+def best(func, repeat=5):
+    result, times = None, []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+    return result, min(times) * 1000
+
+
+def memory(func):
+    gc.collect()
+    tracemalloc.start()
+    result = func()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current / 2 ** 20
+
+
+def main(count=100000):
+    request = Request()
+    pages = [request._parse(json.dumps({'disks': [payload(i) for i in range(start, min(start + 1000, count))]})
+                            .encode()).result['disks'] for start in range(0, count, 1000)]
+
+    def build_objects():
+        return [obj for page in pages for obj in Disk.de_list(page, None)]
+
+    def build_table():
+        return DiskTable.from_pages(pages)
+
+    _, objects_build = best(build_objects)
+    _, table_build = best(build_table)
+    disks, objects_memory = memory(build_objects)
+    table, table_memory = memory(build_table)
+
+    found, objects_scan = best(lambda: [x.id for x in disks if x.size > LIMIT and x.zone_id == 'ru-central1-a'], 20)
+    ids, table_scan = best(lambda: table['id'][(table['size'] > LIMIT) & (table['zone_id'] == 'ru-central1-a')], 20)
+    selected, table_filter = best(lambda: table.filter(table['size'] > LIMIT, zone_id='ru-central1-a'), 20)
+    assert found == list(ids) == list(selected['id'])
+
+    print(f'{count} disks, {len(found)} selected')
+    print(f'{"":<10}{"build, ms":>12}{"memory, MB":>12}{"scan, ms":>12}')
+    print(f'{"objects":<10}{objects_build:>12.1f}{objects_memory:>12.1f}{objects_scan:>12.2f}')
+    print(f'{"table":<10}{table_build:>12.1f}{table_memory:>12.1f}{table_scan:>12.2f}')
+    print(f'table.filter() with the selected rows copied to a new table: {table_filter:.2f} ms')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
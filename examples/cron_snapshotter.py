@@ -224,11 +224,22 @@ if OP_LIMIT <= 1:
     OP_LIMIT = 3
 
 
+snapshot_indexes = {}
+
+
 def list_chunks(lst, n):
     for i in range(0, len(lst), n):
         yield lst[i:i + n]
 
 
+def folder_snapshot_index(folder_id: str):
+    """Returns snapshots of the folder grouped by disk, the folder is listed only once."""
+    if folder_id not in snapshot_indexes:
+        logger.info(f"Building snapshot index for folder {folder_id}")
+        snapshot_indexes[folder_id] = compute.snapshot_index(folder_id)
+    return snapshot_indexes[folder_id]
+
+
 def remove_invalid_instances():
     logger.info("Validating instances...")
     instances = []
@@ -253,10 +264,11 @@ async def snapshot_cleaner(instance_id: str, with_secondary: bool = False):
     """
 
     instance = compute.instance(instance_id)
+    index = folder_snapshot_index(instance.folder_id)
     todo_list = []
     logger.info(f"Searching snapshots older {config.lifetime} days for {instance.name} (id: {instance.id})")
 
-    for snapshot in instance.boot_disk.snapshots():
+    for snapshot in instance.boot_disk.snapshots(index=index):
         if not all(label in snapshot.labels.items() for label in config.labels.items()):
             continue
         if snapshot.age < config.lifetime:
@@ -269,7 +281,7 @@ async def snapshot_cleaner(instance_id: str, with_secondary: bool = False):
 
     if with_secondary:
         for disk in instance.secondary_disks:
-            for snapshot in disk.snapshots():
+            for snapshot in disk.snapshots(index=index):
                 if not all(label in snapshot.labels.items() for label in config.labels.items()):
                     continue
                 if snapshot.age < config.lifetime:
@@ -58,6 +58,11 @@ setup(
     ],
     packages=packages,
     install_requires=requirements,
+    extras_require={
+        'async': ['aiohttp>=3.6'],
+        'orjson': ['orjson>=3.0'],
+        'numpy': ['numpy>=1.17'],
+    },
     include_package_data=True,
     python_requires='>=3.7',
     zip_safe=False
@@ -1,9 +1,10 @@
 #!/usr/bin/env python3
 """A library that provides a Python interface to the Yandex.Cloud REST API."""
 
-from .base import YandexCloudObject
+from .base import YandexCloudObject, LazyList
 
 from .client import YandexCloudClient, ComputeClient, CertificateClient
+from .async_client import AsyncYandexCloudClient, AsyncComputeClient
 
 from .cloud import Cloud
 from .folder import Folder, FolderSpec
@@ -15,29 +16,37 @@ from .compute.image import Image
 from .compute.instance_group import InstanceGroup
 from .compute.instance import Instance, InstanceSpec, ResourcesSpec
 from .compute.placement_group import PlacementGroup
-from .compute.snapshot import Snapshot
+from .compute.snapshot import Snapshot, SnapshotIndex
+from .compute.table import ResourceTable, InstanceTable, DiskTable, SnapshotTable
 
 from .iam.service_account import ServiceAccountAuth
 
 from .utils.decorators import retry, log
+from .utils.cache import ResourceCache
+from .utils.filters import QueryFilter
 from .utils.helpers import generate_instance_yaml_example, instance_dict_example
 from .utils.request import Request
+from .utils.async_request import AsyncRequest
 from .utils.response import Response
 
 from .vpc.address import Address, OneToOneNat
 from .vpc.network_interface import NetworkInterface
 
-from .operation import Operation, OperationWait
+from .operation import Operation, OperationWait, OperationGroup, PollingStrategy
 from .zone import Zone
 from .version import __version__
 
 __author__ = 'akimstrong@yandex.ru'
 
 __all__ = [
-    'YandexCloudObject', 'YandexCloudClient', 'ComputeClient', 'CertificateClient', 'Disk',
+    'YandexCloudObject', 'LazyList', 'YandexCloudClient', 'ComputeClient', 'CertificateClient', 'Disk',
+    'AsyncYandexCloudClient', 'AsyncComputeClient', 'AsyncRequest',
     'Certificate', 'CertificateContent', 'CertificateRequestSpec', 'Challenges', 'DnsChallenges',
     'HttpChallenges', 'DiskSpec', 'AttachedDisk', 'AttachedDiskSpec', 'Image', 'InstanceGroup',
-    'Instance', 'InstanceSpec', 'ResourcesSpec', 'Operation', 'OperationWait', 'PlacementGroup',
-    'Snapshot', 'ServiceAccountAuth', 'retry', 'log', 'Request', 'Response', 'Address', 'OneToOneNat',
+    'Instance', 'InstanceSpec', 'ResourcesSpec', 'Operation', 'OperationWait', 'OperationGroup',
+    'PollingStrategy', 'PlacementGroup',
+    'Snapshot', 'SnapshotIndex', 'ResourceTable', 'InstanceTable', 'DiskTable', 'SnapshotTable',
+    'ServiceAccountAuth', 'QueryFilter', 'ResourceCache', 'retry', 'log', 'Request', 'Response',
+    'Address', 'OneToOneNat',
     'NetworkInterface', 'Zone', 'Cloud', 'Folder', '__version__', '__author__', 'FolderSpec'
 ]
@@ -0,0 +1,634 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""This module contains AsyncYandexCloudClient, AsyncComputeClient classes"""
+
+import logging
+
+from typing import AsyncIterator
+from urllib.parse import quote
+
+from yandex_cloud_client.base import YandexCloudObject
+from yandex_cloud_client.client import YandexCloudClient
+from yandex_cloud_client.utils.async_request import AsyncRequest
+from yandex_cloud_client.utils.decorators import log
+from yandex_cloud_client.utils.helpers import convert_yaml_to_dict, async_prefetch_iterator
+from yandex_cloud_client.error import (YandexCloudError, TooManyArguments, BadRequest, MethodNotAvailable,
+                                       ResourceNotFound)
+
+from yandex_cloud_client.cloud import Cloud
+from yandex_cloud_client.folder import Folder, FolderSpec
+from yandex_cloud_client.operation import Operation, OperationWait
+
+from yandex_cloud_client.compute.disk import Disk, DiskSpec, AttachedDiskSpec
+from yandex_cloud_client.compute.instance import Instance
+from yandex_cloud_client.compute.snapshot import Snapshot, SnapshotSpec, SnapshotIndex
+from yandex_cloud_client.compute.table import InstanceTable, DiskTable, SnapshotTable
+
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncYandexCloudClient(YandexCloudClient):
+    """Yandex.Cloud asyncio Client.
+
+    Same as YandexCloudClient, but every API method is a coroutine
+    and HTTP calls never block the event loop.
+    All requests of the client share a single connection pool,
+    so hundreds of concurrent operations overlap on the network.
+
+    Requires aiohttp: pip install yandex-cloud-client[async]
+
+    Required Args:
+      oauth_token: str
+            or
+      iam_token: str
+            or
+      service_account_key: dict
+
+    Optional Args:
+      request: AsyncRequest
+      pool_size: int
+      keep_alive: bool
+      polling: PollingStrategy
+      base_url: str
+      compute_url: str
+      resource_manager_url: str
+      iam_url: str
+      operation_url: str
+      certificate_url: str
+      certificate_data_url: str
+
+    The client can be used as an async context manager:
+
+      async with AsyncComputeClient(oauth_token='...') as compute:
+          await compute.start_instance('...')
+
+    """
+
+    _request_class = AsyncRequest
+
+    def __enter__(self):
+        raise TypeError('Use "async with" for the async client')
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        """Close the shared connection pool of the client."""
+        await self._request.close()
+
+    # Private methods for AsyncComputeClient workflow
+
+    async def _await_operation(self, response, await_complete=True) -> Operation:
+        operation = self._evict_cached(Operation.de_json(response, self))
+        if not await_complete:
+            return operation
+        waiter = OperationWait(operation, timeout=self.operation_timeout, polling=self.polling)
+        return self._evict_cached(await waiter.await_complete_async())
+
+    async def _fetch_pages(self, url, key, params=None) -> AsyncIterator[list]:
+        params = dict(params or {})
+        while True:
+            response = await self._request.get(url, params=params)
+            yield response.get(key) or []
+
+            page_token = response.get('next_page_token')
+            if not page_token:
+                return
+            params['pageToken'] = page_token
+
+    def _iter_pages(self, url, key, params=None, prefetch=0) -> AsyncIterator[list]:
+        """Lazily yields raw resources of each page, following the page tokens.
+        With prefetch > 0, up to `prefetch` next pages are fetched in the background
+        while the current page is processed.
+        """
+        pages = self._fetch_pages(url, key, params=params)
+        if prefetch:
+            return async_prefetch_iterator(pages, depth=prefetch)
+        return pages
+
+    async def _paginate(self, url, key, resource_class, params=None, prefetch=0) -> AsyncIterator[YandexCloudObject]:
+        """Lazily yields resources as objects, only one page (plus prefetched) is kept in memory."""
+        async for page in self._iter_pages(url, key, params=params, prefetch=prefetch):
+            for resource in resource_class.de_list(page, self):
+                yield resource
+
+    async def _get_resource(self, resource_type: str, resource_id: str, url: str, use_cache=True) -> dict:
+        """Returns the raw resource, from the cache if it is enabled and use_cache is True.
+        Received resource (or not found error) is put to the cache even if use_cache is False.
+        """
+        if self.cache is not None and use_cache:
+            message = self.cache.get_missing(resource_type, resource_id)
+            if message is not None:
+                raise ResourceNotFound(message)
+
+            response = self.cache.get(resource_type, resource_id)
+            if response is not None:
+                return response
+
+        try:
+            response = await self._request.get(url)
+        except ResourceNotFound as e:
+            if self.cache is not None:
+                self.cache.set_missing(resource_type, resource_id, str(e))
+            raise
+
+        if self.cache is not None:
+            self.cache.set(resource_type, resource_id, response)
+        return response
+
+    async def _delete_resource(self, url, await_complete=True) -> Operation:
+        """Wrapper for delete resources."""
+        response = await self._request.delete(url)
+        return await self._await_operation(response, await_complete=await_complete)
+
+    async def _resource_create(self, url, data=None, await_complete=True) -> Operation:
+        """Wrapper for create resource."""
+        response = await self._request.post(url, json=data)
+        return await self._await_operation(response, await_complete=await_complete)
+
+    # Operations public methods
+
+    def watch_operation(self, operation: Operation, callback=None):
+        raise MethodNotAvailable('Shared operation poller is not supported by the async client, use OperationGroup')
+
+    def crawl(self, *args, **kwargs):
+        raise MethodNotAvailable('Crawler is not supported by the async client, use iter_* methods with asyncio.gather')
+
+    @log
+    async def operation(self, operation_id: str) -> Operation:
+        """Returns operation as object."""
+        url = f'{self.operation_url}/operations/{operation_id}'
+        response = await self._request.get(url)
+        return Operation.de_json(response, self)
+
+    @log
+    async def cancel_operation(self, operation_id: str) -> Operation:
+        """Cancels the operation if possible."""
+        url = f'{self.operation_url}/operations/{operation_id}:cancel'
+        try:
+            response = await self._request.post(url)
+            return Operation.de_json(response, self)
+        except YandexCloudError:
+            raise BadRequest("Operation can't be canceled.")
+
+    @log
+    async def cloud(self, cloud_id: str, use_cache=True) -> Cloud:
+        """Returns cloud as object."""
+        url = f'{self.resource_manager_url}/resource-manager/v1/clouds/{cloud_id}'
+
+        response = await self._get_resource('cloud', cloud_id, url, use_cache=use_cache)
+        return Cloud.de_json(response, self)
+
+    @log
+    async def available_clouds(self, page_size: int = 1000, query_filter: str = None) -> [Cloud]:
+        """Returns list of available clouds for account."""
+        url = f'{self.resource_manager_url}/resource-manager/v1/clouds?pageSize={page_size}'
+
+        if query_filter:
+            url += f'&filter={quote(str(query_filter), safe="")}'
+
+        response = (await self._request.get(url)).get('clouds')
+        return Cloud.de_list(response, self)
+
+    @log
+    def iter_available_clouds(self, page_size: int = 1000,
+                              query_filter: str = None, prefetch=0) -> AsyncIterator[Cloud]:
+        """Lazily yields all available clouds for account, page by page."""
+        url = f'{self.resource_manager_url}/resource-manager/v1/clouds?pageSize={page_size}'
+
+        if query_filter:
+            url += f'&filter={quote(str(query_filter), safe="")}'
+
+        return self._paginate(url, 'clouds', Cloud, prefetch=prefetch)
+
+    @log
+    async def cloud_operations(self, cloud_id: str, page_size=1000) -> [Operation]:
+        """Returns list of operations in the cloud."""
+        url = f'{self.resource_manager_url}/resource-manager/v1/clouds/{cloud_id}/operations?pageSize={page_size}'
+        response = (await self._request.get(url)).get('operations')
+        return Operation.de_list(response, self)
+
+    @log
+    def iter_cloud_operations(self, cloud_id: str, page_size=1000, prefetch=0) -> AsyncIterator[Operation]:
+        """Lazily yields all operations in the cloud, page by page."""
+        url = f'{self.resource_manager_url}/resource-manager/v1/clouds/{cloud_id}/operations?pageSize={page_size}'
+        return self._paginate(url, 'operations', Operation, prefetch=prefetch)
+
+    @log
+    async def folder(self, folder_id: str, use_cache=True) -> Folder:
+        """Returns folder as object."""
+        url = f'{self.resource_manager_url}/resource-manager/v1/folders/{folder_id}'
+
+        response = await self._get_resource('folder', folder_id, url, use_cache=use_cache)
+        return Folder.de_json(response, self)
+
+    @log
+    async def folders_in_cloud(self, cloud_id: str, page_size: int = 1000, query_filter: str = None) -> [Folder]:
+        """Returns all available folders for user / service account,
+        depending on the type of authorization and permissions.
+        """
+        url = f'{self.resource_manager_url}/resource-manager/v1/folders?cloudId={cloud_id}&pageSize={page_size}'
+
+        if query_filter:
+            url += f'&filter={quote(str(query_filter), safe="")}'
+
+        response = await self._request.get(url)
+        return Folder.de_list(response.get('folders'), self)
+
+    @log
+    def iter_folders_in_cloud(self, cloud_id: str, page_size: int = 1000,
+                              query_filter: str = None, prefetch=0) -> AsyncIterator[Folder]:
+        """Lazily yields all available folders in the cloud, page by page."""
+        url = f'{self.resource_manager_url}/resource-manager/v1/folders?cloudId={cloud_id}&pageSize={page_size}'
+
+        if query_filter:
+            url += f'&filter={quote(str(query_filter), safe="")}'
+
+        return self._paginate(url, 'folders', Folder, prefetch=prefetch)
+
+    @log
+    async def folder_operations(self, folder_id: str, page_size=1000) -> [Operation]:
+        """Returns list of operations in the folder."""
+        url = f'{self.resource_manager_url}/resource-manager/v1/folders/{folder_id}/operations?pageSize={page_size}'
+        response = (await self._request.get(url)).get('operations')
+        return Operation.de_list(response, self)
+
+    @log
+    def iter_folder_operations(self, folder_id: str, page_size=1000, prefetch=0) -> AsyncIterator[Operation]:
+        """Lazily yields all operations in the folder, page by page."""
+        url = f'{self.resource_manager_url}/resource-manager/v1/folders/{folder_id}/operations?pageSize={page_size}'
+        return self._paginate(url, 'operations', Operation, prefetch=prefetch)
+
+    @log
+    async def create_folder(self, cloud_id: str, name: str, await_complete=True) -> Operation:
+        """Create folder in the specified cloud."""
+        url = f'{self.resource_manager_url}/resource-manager/v1/folders'
+
+        params = locals().copy()
+        del params['self']
+        data = FolderSpec.prepare(params, self)
+
+        return await self._resource_create(url, data=data, await_complete=await_complete)
+
+    # Aliases
+
+    cancelOperation = cancel_operation
+
+
+class AsyncComputeClient(AsyncYandexCloudClient):
+    """Yandex.Cloud asyncio Compute Client.
+
+    Same as ComputeClient, but every API method is a coroutine:
+
+      instance = await compute.instance('...')
+      await instance.stop()
+
+    Child class, which inherit the properties and methods
+    from the AsyncYandexCloudClient parent class.
+
+    """
+
+    async def _instance_state_management(self, action=None, instance_id=None,
+                                         await_complete=True) -> Operation:
+        """Helper func for managing the state of the instance.
+        Supported actions: start, restart, stop.
+        """
+
+        ACTIONS = ('start', 'restart', 'stop')
+        if action not in ACTIONS:
+            raise TypeError(f'Action {action} not supported')
+
+        url = f'{self.compute_url}/compute/v1/instances/{instance_id}:{action}'
+        response = await self._request.post(url)
+        return await self._await_operation(response, await_complete=await_complete)
+
+    async def _instance_disk_management(self, instance_id: str, data=None,
+                                        action=None, await_complete=True) -> Operation:
+        """Helper func for managing the state of the disk.
+        Supported actions: detachDisk, attachDisk.
+        """
+
+        ACTIONS = ('detachDisk', 'attachDisk')
+        if action not in ACTIONS:
+            raise TypeError(f'Action {action} not supported')
+
+        url = f'{self.compute_url}/compute/v1/instances/{instance_id}:{action}'
+        response = await self._request.post(url, json=data)
+        return await self._await_operation(response, await_complete=await_complete)
+
+    async def _convert_attached_disks(self, disks: list) -> Disk:
+        """Helpers func for convert instance attached disks."""
+        attached_disks = []
+        for disk_id in disks:
+            attached_disks.append(await self.disk(disk_id, raw=True))
+        return Disk.de_list(attached_disks, self)
+
+    # Instance public methods
+
+    @log
+    async def instance(self, instance_id: str, metadata=False, use_cache=True) -> Instance:
+        """Returns instance as object.
+        Only BASIC view is cached, instance with metadata (FULL view) is always requested from the API.
+        """
+        url = f'{self.compute_url}/compute/v1/instances/{instance_id}'
+
+        if metadata:
+            response = await self._request.get(url + '?view=FULL')
+        else:
+            response = await self._get_resource('instance', instance_id, url, use_cache=use_cache)
+        return Instance.de_json(response, self)
+
+    @log
+    async def instances_in_folder(self, folder_id: str, page_size=1000, query_filter=None, lazy=False) -> [Instance]:
+        """Returns list of instances in the folder."""
+        url = f'{self.compute_url}/compute/v1/instances?folderId={folder_id}&pageSize={page_size}'
+        if query_filter:
+            url += f'&filter={quote(str(query_filter), safe="")}'
+        response = (await self._request.get(url)).get('instances')
+        return Instance.de_list(response, self, lazy=lazy)
+
+    @log
+    def iter_instances_in_folder(self, folder_id: str, page_size=1000,
+                                 query_filter=None, prefetch=0) -> AsyncIterator[Instance]:
+        """Lazily yields all instances in the folder, page by page."""
+        url = f'{self.compute_url}/compute/v1/instances?folderId={folder_id}&pageSize={page_size}'
+        if query_filter:
+            url += f'&filter={quote(str(query_filter), safe="")}'
+        return self._paginate(url, 'instances', Instance, prefetch=prefetch)
+
+    @log
+    async def instance_table(self, folder_id: str, page_size=1000, query_filter=None, prefetch=0) -> InstanceTable:
+        """Lists all instances in the folder as InstanceTable, without creating objects."""
+        url = f'{self.compute_url}/compute/v1/instances?folderId={folder_id}&pageSize={page_size}'
+        if query_filter:
+            url += f'&filter={quote(str(query_filter), safe="")}'
+        pages = [page async for page in self._iter_pages(url, 'instances', prefetch=prefetch)]
+        return InstanceTable.from_pages(pages)
+
+    @log
+    async def instance_serial_port_output(self, instance_id: str, port=1) -> str:
+        """Returns instance serial port output as string."""
+        url = f'{self.compute_url}/compute/v1/instances/{instance_id}:serialPortOutput?port={port}'
+        response = (await self._request.get(url)).get('contents')
+        return response
+
+    @log
+    async def instance_operations(self, instance_id: str, page_size=1000) -> [Operation]:
+        """Returns list of instance operations."""
+        url = f'{self.compute_url}/compute/v1/instances/{instance_id}/operations?pageSize={page_size}'
+        response = (await self._request.get(url)).get('operations')
+        return Operation.de_list(response, self)
+
+    @log
+    def iter_instance_operations(self, instance_id: str, page_size=1000, prefetch=0) -> AsyncIterator[Operation]:
+        """Lazily yields all instance operations, page by page."""
+        url = f'{self.compute_url}/compute/v1/instances/{instance_id}/operations?pageSize={page_size}'
+        return self._paginate(url, 'operations', Operation, prefetch=prefetch)
+
+    @log
+    async def instance_attach_existent_disk(self, instance_id: str, disk_id: str, mode='READ_WRITE',
+                                            device_name=None, auto_delete=False,
+                                            await_complete=True) -> Operation:
+        """Attach existent disk to the specified instance."""
+
+        # prepare valid data for disk
+        params = locals().copy()
+        del params['self']
+        data = {'attachedDiskSpec': AttachedDiskSpec.prepare(params, self)}
+
+        return await self._instance_disk_management(instance_id, action='attachDisk',
+                                                    data=data, await_complete=await_complete)
+
+    @log
+    async def instance_attach_new_disk(self, instance_id: str, size: int, mode='READ_WRITE',
+                                       auto_delete=None, name=None, description=None, type_id=None,
+                                       image_id=None, snapshot_id=None, device_name=None,
+                                       await_complete=True) -> Operation:
+        """Create new disk and attach him to the instance."""
+
+        # prepare valid data for disk
+        params = locals().copy()
+        del params['self']
+        data = {'attachedDiskSpec': AttachedDiskSpec.prepare(params, self)}
+
+        return await self._instance_disk_management(instance_id, action='attachDisk',
+                                                    data=data, await_complete=await_complete)
+
+    @log
+    async def instance_detach_disk(self, instance_id: str, disk_id=None, disk_name=None,
+                                   await_complete=True) -> Operation:
+        """Detach disk from the instance."""
+        if disk_id and disk_name:
+            raise TooManyArguments('disk_id and disk_name received, but you can use only one param')
+
+        if disk_id:
+            data = {'diskId': disk_id}
+        elif disk_name:
+            data = {'diskName': disk_name}
+
+        return await self._instance_disk_management(instance_id, action='detachDisk',
+                                                    data=data, await_complete=await_complete)
+
+    @log
+    async def start_instance(self, instance_id: str, await_complete=True) -> Operation:
+        """Start specified instance and return operation as object."""
+        return await self._instance_state_management(action='start',
+                                                     instance_id=instance_id, await_complete=await_complete)
+
+    @log
+    async def restart_instance(self, instance_id: str, await_complete=True) -> Operation:
+        """Restart specified instance and return operation as object."""
+        return await self._instance_state_management(action='restart',
+                                                     instance_id=instance_id, await_complete=await_complete)
+
+    @log
+    async def stop_instance(self, instance_id: str, await_complete=True) -> Operation:
+        """Stop specified instance and return operation as object."""
+        return await self._instance_state_management(action='stop',
+                                                     instance_id=instance_id, await_complete=await_complete)
+
+    @log
+    async def delete_instance(self, instance_id: str, await_complete=True) -> Operation:
+        """Delete specified instance and return operation as object."""
+        url = self.compute_url + f'/compute/v1/instances/{instance_id}'
+        return await self._delete_resource(url, await_complete=await_complete)
+
+    @log
+    async def create_instance(self, yaml_spec, await_complete=True) -> Operation:
+        """Create instance from the yaml spec, see ComputeClient.create_instance()."""
+        url = f'{self.compute_url}/compute/v1/instances'
+        data = convert_yaml_to_dict(yaml_spec)
+
+        return await self._resource_create(url, data=data, await_complete=await_complete)
+
+    # Disks public methods
+
+    @log
+    async def disk(self, disk_id: str, raw=False, use_cache=True) -> Disk:
+        """Returns a disk as object."""
+        url = f'{self.compute_url}/compute/v1/disks/{disk_id}'
+        response = await self._get_resource('disk', disk_id, url, use_cache=use_cache)
+        if raw:
+            return response
+        return Disk.de_json(response, self)
+
+    @log
+    async def disk_operations(self, disk_id: str, page_size=1000) -> [Operation]:
+        """Returns list of the disk operations."""
+        url = f'{self.compute_url}/compute/v1/disks/{disk_id}/operations?pageSize={page_size}'
+        response = (await self._request.get(url)).get('operations')
+        return Operation.de_list(response, self)
+
+    @log
+    def iter_disk_operations(self, disk_id: str, page_size=1000, prefetch=0) -> AsyncIterator[Operation]:
+        """Lazily yields all disk operations, page by page."""
+        url = f'{self.compute_url}/compute/v1/disks/{disk_id}/operations?pageSize={page_size}'
+        return self._paginate(url, 'operations', Operation, prefetch=prefetch)
+
+    @log
+    async def disks_in_folder(self, folder_id: str, page_size=1000, query_filter=None, lazy=False) -> [Disk]:
+        """Return list of the disks in a folder."""
+        url = f'{self.compute_url}/compute/v1/disks?folderId={folder_id}&pageSize={page_size}'
+        if query_filter:
+            url += f'&filter={quote(str(query_filter), safe="")}'
+        response = (await self._request.get(url)).get('disks')
+        return Disk.de_list(response, self, lazy=lazy)
+
+    @log
+    def iter_disks_in_folder(self, folder_id: str, page_size=1000,
+                             query_filter=None, prefetch=0) -> AsyncIterator[Disk]:
+        """Lazily yields all disks in the folder, page by page."""
+        url = f'{self.compute_url}/compute/v1/disks?folderId={folder_id}&pageSize={page_size}'
+        if query_filter:
+            url += f'&filter={quote(str(query_filter), safe="")}'
+        return self._paginate(url, 'disks', Disk, prefetch=prefetch)
+
+    @log
+    async def disk_table(self, folder_id: str, page_size=1000, query_filter=None, prefetch=0) -> DiskTable:
+        """Lists all disks in the folder as DiskTable, without creating objects."""
+        url = f'{self.compute_url}/compute/v1/disks?folderId={folder_id}&pageSize={page_size}'
+        if query_filter:
+            url += f'&filter={quote(str(query_filter), safe="")}'
+        pages = [page async for page in self._iter_pages(url, 'disks', prefetch=prefetch)]
+        return DiskTable.from_pages(pages)
+
+    @log
+    async def delete_disk(self, disk_id: str, await_complete=True) -> Operation:
+        """Delete specified disk and returns operation as object."""
+        url = f'{self.compute_url}/compute/v1/disks/{disk_id}'
+        return await self._delete_resource(url, await_complete=await_complete)
+
+    @log
+    async def create_disk(self, folder_id: str, size: int, zone_id: str, name=None,
+                          description=None, labels=None, type_id=None, image_id=None,
+                          snapshot_id=None, await_complete=True) -> Operation:
+        """Create disk and returns operation as object."""
+
+        url = f'{self.compute_url}/compute/v1/disks'
+
+        # Prepare valid data for new disk
+        params = locals().copy()
+        del params['self']
+        data = DiskSpec.prepare(params, self)
+
+        return await self._resource_create(url, data=data, await_complete=await_complete)
+
+    # Snapshots public methods
+
+    @log
+    async def snapshot(self, snapshot_id: str, use_cache=True) -> Snapshot:
+        """Returns the snapshot as object."""
+        url = f'{self.compute_url}/compute/v1/snapshots/{snapshot_id}'
+        response = await self._get_resource('snapshot', snapshot_id, url, use_cache=use_cache)
+        return Snapshot.de_json(response, self)
+
+    @log
+    async def snapshot_operations(self, snapshot_id: str, page_size=1000) -> [Operation]:
+        """Returns list of the snapshot operations."""
+        url = f'{self.compute_url}/compute/v1/snapshots/{snapshot_id}/operations?pageSize={page_size}'
+        response = (await self._request.get(url)).get('operations')
+        return Operation.de_list(response, self)
+
+    @log
+    def iter_snapshot_operations(self, snapshot_id: str, page_size=1000, prefetch=0) -> AsyncIterator[Operation]:
+        """Lazily yields all snapshot operations, page by page."""
+        url = f'{self.compute_url}/compute/v1/snapshots/{snapshot_id}/operations?pageSize={page_size}'
+        return self._paginate(url, 'operations', Operation, prefetch=prefetch)
+
+    @log
+    async def snapshots_in_folder(self, folder_id: str, page_size=1000, query_filter=None, lazy=False) -> [Snapshot]:
+        """Returns list of the snapshots in a folder."""
+        url = f'{self.compute_url}/compute/v1/snapshots?folderId={folder_id}&pageSize={page_size}'
+        if query_filter:
+            url += f'&filter={quote(str(query_filter), safe="")}'
+        response = (await self._request.get(url)).get('snapshots')
+        return Snapshot.de_list(response, self, lazy=lazy)
+
+    @log
+    def iter_snapshots_in_folder(self, folder_id: str, page_size=1000,
+                                 query_filter=None, prefetch=0) -> AsyncIterator[Snapshot]:
+        """Lazily yields all snapshots in the folder, page by page."""
+        url = f'{self.compute_url}/compute/v1/snapshots?folderId={folder_id}&pageSize={page_size}'
+        if query_filter:
+            url += f'&filter={quote(str(query_filter), safe="")}'
+        return self._paginate(url, 'snapshots', Snapshot, prefetch=prefetch)
+
+    @log
+    async def snapshot_index(self, folder_id: str, page_size=1000, query_filter=None, prefetch=0) -> SnapshotIndex:
+        """Lists all snapshots in the folder once and returns them grouped by source disk."""
+        snapshots = [snapshot async for snapshot in self.iter_snapshots_in_folder(
+            folder_id, page_size=page_size, query_filter=query_filter, prefetch=prefetch)]
+        return SnapshotIndex(snapshots, folder_id=folder_id)
+
+    @log
+    async def snapshot_table(self, folder_id: str, page_size=1000, query_filter=None, prefetch=0) -> SnapshotTable:
+        """Lists all snapshots in the folder as SnapshotTable, without creating objects."""
+        url = f'{self.compute_url}/compute/v1/snapshots?folderId={folder_id}&pageSize={page_size}'
+        if query_filter:
+            url += f'&filter={quote(str(query_filter), safe="")}'
+        pages = [page async for page in self._iter_pages(url, 'snapshots', prefetch=prefetch)]
+        return SnapshotTable.from_pages(pages)
+
+    @log
+    async def create_snapshot(self, folder_id: str, disk_id: str, name=None, description=None,
+                              labels=None, await_complete=True) -> Operation:
+        """Create the snapshot for specified disk and return operation as object."""
+        url = f'{self.compute_url}/compute/v1/snapshots'
+
+        params = locals().copy()
+        del params['self']
+        data = SnapshotSpec.prepare(params, self)
+
+        return await self._resource_create(url, data=data, await_complete=await_complete)
+
+    @log
+    async def delete_snapshot(self, snapshot_id: str, await_complete=True) -> Operation:
+        """Delete specified snapshot and returns operation as object."""
+        url = f'{self.compute_url}/compute/v1/snapshots/{snapshot_id}'
+        return await self._delete_resource(url, await_complete=await_complete)
+
+    # Aliases
+
+    startInstance = start_instance
+    stopInstance = stop_instance
+    restartInstance = restart_instance
+    createInstance = create_instance
+    deleteInstance = delete_instance
+    instanceSerialPortOut = instance_serial_port_output
+    folderInstances = instances_in_folder
+    instanceOperations = instance_operations
+    instanceAttachNewDisk = instance_attach_new_disk
+    instanceAttachExistentDisk = instance_attach_existent_disk
+    instanceDetachDisk = instance_detach_disk
+    diskOperations = disk_operations
+    folderDisks = disks_in_folder
+    deleteDisk = delete_disk
+    createDisk = create_disk
+    snapshotOperations = snapshot_operations
+    folderSnapshots = snapshots_in_folder
+    createSnapshot = create_snapshot
+    deleteSnapshot = delete_snapshot
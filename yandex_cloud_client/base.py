@@ -1,20 +1,51 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
-"""This module contains YandexCloudObject parent class."""
+"""This module contains YandexCloudObject parent class and LazyList."""
 
 import json
 import logging
+import functools
 
 from abc import ABCMeta
+from collections.abc import Sequence
+
+from yandex_cloud_client.utils.fields import compile_deserializer
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=None)
+def _slot_names(cls) -> tuple:
+    """Returns all slots of the class and its parents in definition order."""
+    names = []
+    for klass in reversed(cls.__mro__):
+        slots = klass.__dict__.get('__slots__', ())
+        names.extend((slots,) if isinstance(slots, str) else slots)
+    return tuple(names)
+
+
 class YandexCloudObject(object):
-    """Base class for Yandex.Cloud objects."""
+    """Base class for Yandex.Cloud objects.
+
+    Models declare their fields in __slots__, so the objects have no __dict__,
+    the fields compared by __eq__ and __hash__ in _id_fields
+    and the way the fields are read from API dicts in _field_table (see utils.fields).
+
+    """
 
     __metaclass__ = ABCMeta
-    _id_attrs = ()
+    __slots__ = ()
+    _id_fields = ()
+
+    @property
+    def _id_attrs(self) -> tuple:
+        return tuple(getattr(self, field, None) for field in self._id_fields)
+
+    def _fields(self) -> dict:
+        """Returns fields of the object (slots and __dict__) as dict."""
+        data = {name: getattr(self, name) for name in _slot_names(self.__class__) if hasattr(self, name)}
+        data.update(getattr(self, '__dict__', {}))
+        return data
 
     def __str__(self):
         return str(self.to_dict())
@@ -23,24 +54,47 @@ class YandexCloudObject(object):
         return str(self)
 
     def __getitem__(self, item):
-        return self.__dict__[item]
+        if item in _slot_names(self.__class__) and hasattr(self, item):
+            return getattr(self, item)
+        return getattr(self, '__dict__', {})[item]
 
     @staticmethod
     def handle_unknown_kwargs(obj, **kwargs):
         """Logging unparsed fields from Yandex.Cloud API."""
-        if kwargs:
-            logger.debug(f'Unparsed fields received from API')
-            logger.debug(f'Type: {type(obj)}; kwargs: {kwargs}')
+        if kwargs and logger.isEnabledFor(logging.DEBUG):
+            logger.debug('Unparsed fields received from API')
+            logger.debug('Type: %s; kwargs: %s', type(obj), kwargs)
 
     @classmethod
     def de_json(cls, data: dict, client):
-        """Deserialize object."""
+        """Deserialize object.
+        Models with _field_table get the generated deserializer on the first call,
+        for others (specifications) returns a copy of data.
+        """
+        if '_field_table' in cls.__dict__:
+            deserializer = compile_deserializer(cls)
+            cls.de_json = classmethod(deserializer)
+            return deserializer(cls, data, client)
+
         if not data:
             return None
 
         data = data.copy()
         return data
 
+    @classmethod
+    def de_list(cls, data: list, client, lazy=False):
+        """Deserialize list of objects.
+        If lazy is True, returns LazyList, objects are created only on access.
+        """
+        if lazy:
+            return LazyList(data, cls, client)
+
+        if not data:
+            return []
+
+        return [cls.de_json(item, client) for item in data]
+
     def to_json(self):
         """Serialize object to json."""
         return json.dumps(self.to_dict())
@@ -57,7 +111,7 @@ class YandexCloudObject(object):
             else:
                 return val
 
-        data = self.__dict__.copy()
+        data = self._fields()
         data.pop('client', None)
         data.pop('_id_attrs', None)
 
@@ -79,3 +133,81 @@ class YandexCloudObject(object):
         if self._id_attrs:
             return hash((self.__class__, self._id_attrs))
         return super(YandexCloudObject, self).__hash__()
+
+
+class LazyList(Sequence):
+    """This object represents a list of the objects, created from raw API dicts on access.
+
+    Created objects are cached, so every element is deserialized only once.
+    filter() and first() match raw fields (snake_case keys, values as sent by API,
+    e.g. int64 as str), without creating objects. Nested fields are separated by `__`:
+
+      instances.filter(status='RUNNING', labels__env='prod').first(zone_id='ru-central1-a')
+
+    """
+
+    __slots__ = ('_data', '_objects', '_cls', '_client')
+
+    def __init__(self, data: list, cls, client, objects: list = None):
+        self._data = list(data or ())
+        self._objects = objects if objects is not None else [None] * len(self._data)
+        self._cls = cls
+        self._client = client
+
+    def __len__(self):
+        return len(self._data)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return LazyList(self._data[index], self._cls, self._client, self._objects[index])
+
+        obj = self._objects[index]
+        if obj is None:
+            obj = self._objects[index] = self._cls.de_json(self._data[index], self._client)
+        return obj
+
+    def __iter__(self):
+        for index in range(len(self._data)):
+            yield self[index]
+
+    def __eq__(self, other):
+        if isinstance(other, (list, LazyList)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self._cls.__name__}, {len(self)} items)'
+
+    @property
+    def raw(self) -> list:
+        """Raw dicts of the objects."""
+        return self._data
+
+    @staticmethod
+    def _match(item: dict, predicate, fields: dict) -> bool:
+        for field, expected in fields.items():
+            value = item
+            for key in field.split('__'):
+                value = value.get(key) if isinstance(value, dict) else None
+            if value != expected:
+                return False
+        return predicate is None or predicate(item)
+
+    def filter(self, predicate=None, **fields) -> 'LazyList':
+        """Returns LazyList of the objects with matched raw fields (and predicate(raw) is True)."""
+        indexes = [i for i, item in enumerate(self._data) if self._match(item, predicate, fields)]
+        return LazyList([self._data[i] for i in indexes], self._cls, self._client,
+                        [self._objects[i] for i in indexes])
+
+    def first(self, predicate=None, **fields):
+        """Returns the first object with matched raw fields or None."""
+        for index, item in enumerate(self._data):
+            if self._match(item, predicate, fields):
+                return self[index]
+        return None
+
+    def count(self, *args, predicate=None, **fields) -> int:
+        """Without arguments returns number of the objects with matched raw fields."""
+        if args:
+            return super().count(*args)
+        return sum(1 for item in self._data if self._match(item, predicate, fields))
@@ -4,7 +4,8 @@
 import logging
 
 from yandex_cloud_client.base import YandexCloudObject
-from yandex_cloud_client.utils.helpers import universal_obj_hook, string_to_datetime
+from yandex_cloud_client.utils.fields import Field
+from yandex_cloud_client.utils.helpers import string_to_datetime
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +33,30 @@ class Certificate(YandexCloudObject):
 
     """
 
+    __slots__ = (
+        'id', 'folder_id', 'created_at', 'name', 'description', 'labels', 'type', 'domains', 'status',
+        'subject', 'serial', 'updated_at', 'issued_at', 'not_after', 'not_before', 'challenges', 'client'
+    )
+    _id_fields = ('id',)
+    _field_table = (
+        Field('id'),
+        Field('folder_id'),
+        Field('created_at', string_to_datetime),
+        Field('name'),
+        Field('description'),
+        Field('labels', default=dict),
+        Field('type'),
+        Field('domains'),
+        Field('status'),
+        Field('subject'),
+        Field('serial'),
+        Field('updated_at', string_to_datetime),
+        Field('issued_at', string_to_datetime),
+        Field('not_after', string_to_datetime),
+        Field('not_before', string_to_datetime),
+        Field('challenges', nested='Challenges', many=True),
+    )
+
     def __init__(self,
                  id=None,
                  folder_id=None,
@@ -75,32 +100,11 @@ class Certificate(YandexCloudObject):
         self.challenges = challenges
 
         self.client = client
-        self._id_attrs = (self.id,)
 
     @property
     def expires(self):
         return self.not_after
 
-    @classmethod
-    def de_json(cls, data: dict, client):
-        if not data:
-            return None
-
-        data = super(Certificate, cls).de_json(data, client)
-        data['challenges'] = Challenges.de_list(universal_obj_hook(data.get('challenges')), client)
-        return cls(client=client, **data)
-
-    @classmethod
-    def de_list(cls, data: list, client):
-        if not data:
-            return []
-
-        certificates = list()
-        for certificate in data:
-            certificates.append(cls.de_json(certificate, client))
-
-        return certificates
-
     def content(self, *args, **kwargs):
         """Shortcut for client.certificate_content()."""
         return self.client.certificate_content(self.id, *args, **kwargs)
@@ -113,6 +117,22 @@ class Certificate(YandexCloudObject):
 class Challenges(YandexCloudObject):
     """This object represents the certificate challenges."""
 
+    __slots__ = (
+        'domain', 'type', 'created_at', 'updated_at', 'status', 'message', 'error', 'dns_challenge',
+        'http_challenge', 'client'
+    )
+    _field_table = (
+        Field('domain'),
+        Field('type'),
+        Field('created_at', string_to_datetime),
+        Field('updated_at', string_to_datetime),
+        Field('status'),
+        Field('message'),
+        Field('error'),
+        Field('dns_challenge', nested='DnsChallenges'),
+        Field('http_challenge', nested='HttpChallenges'),
+    )
+
     def __init__(self,
                  domain=None,
                  type=None,
@@ -140,33 +160,17 @@ class Challenges(YandexCloudObject):
 
         self.client = client
 
-    @classmethod
-    def de_json(cls, data: dict, client):
-        if not data:
-            return None
-
-        data = super(Challenges, cls).de_json(data, client)
-
-        data['dns_challenge'] = DnsChallenges.de_json(universal_obj_hook(data.get('dns_challenge')), client)
-        data['http_challenge'] = HttpChallenges.de_json(universal_obj_hook(data.get('http_challenge')), client)
-
-        return cls(client=client, **data)
-
-    @classmethod
-    def de_list(cls, data: list, client):
-        if not data:
-            return []
-
-        challenges = list()
-        for challenge in data:
-            challenges.append(cls.de_json(challenge, client))
-
-        return challenges
-
 
 class DnsChallenges(YandexCloudObject):
     """This object represents a DNS Challenge for the certificate."""
 
+    __slots__ = ('name', 'type', 'value', 'client')
+    _field_table = (
+        Field('name'),
+        Field('type'),
+        Field('value'),
+    )
+
     def __init__(self,
                  name=None,
                  type=None,
@@ -182,18 +186,16 @@ class DnsChallenges(YandexCloudObject):
 
         self.client = client
 
-    @classmethod
-    def de_json(cls, data: dict, client):
-        if not data:
-            return None
-
-        data = super(DnsChallenges, cls).de_json(data, client)
-        return cls(client=client, **data)
-
 
 class HttpChallenges(YandexCloudObject):
     """This object represents a HTTP Challenge for the certificate."""
 
+    __slots__ = ('url', 'content', 'client')
+    _field_table = (
+        Field('url'),
+        Field('content'),
+    )
+
     def __init__(self,
                  url=None,
                  content=None,
@@ -207,18 +209,19 @@ class HttpChallenges(YandexCloudObject):
 
         self.client = client
 
-    @classmethod
-    def de_json(cls, data: dict, client):
-        if not data:
-            return None
-
-        data = super(HttpChallenges, cls).de_json(data, client)
-        return cls(client=client, **data)
-
 
 class CertificateContent(YandexCloudObject):
     """This object represents a content for the certificate."""
 
+    __slots__ = ('id', 'certificate_id', 'certificate_chain', 'private_key', 'client')
+    _id_fields = ('id',)
+    _field_table = (
+        Field('id', key='certificate_id'),
+        Field('certificate_id'),
+        Field('certificate_chain'),
+        Field('private_key'),
+    )
+
     def __init__(self,
                  id=None,
                  certificate_id=None,
@@ -235,7 +238,6 @@ class CertificateContent(YandexCloudObject):
         self.private_key = private_key
 
         self.client = client
-        self._id_attrs = (self.id,)
 
     @property
     def chain(self):
@@ -245,14 +247,6 @@ class CertificateContent(YandexCloudObject):
     def fullchain(self):
         return self.certificate_chain
 
-    @classmethod
-    def de_json(cls, data: dict, client):
-        if not data:
-            return None
-
-        data = super(CertificateContent, cls).de_json(data, client)
-        return cls(client=client, **data)
-
 
 class CertificateRequestSpec(YandexCloudObject):
     """This object represents a specification for new certificate."""
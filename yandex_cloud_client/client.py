@@ -3,16 +3,21 @@
 """This module contains YandexCloudClient, ComputeClient classes"""
 
 import json
+import asyncio
 import logging
 import requests
 
 from types import CoroutineType
+from typing import Iterator
+from urllib.parse import quote
+from concurrent.futures import Future
 
 from yandex_cloud_client.base import YandexCloudObject
 
+from yandex_cloud_client.utils.cache import ResourceCache
 from yandex_cloud_client.utils.request import Request
 from yandex_cloud_client.utils.decorators import log
-from yandex_cloud_client.utils.helpers import convert_yaml_to_dict
+from yandex_cloud_client.utils.helpers import convert_yaml_to_dict, run_blocking, prefetch_iterator
 from yandex_cloud_client.utils.endpoints import (
     BASE_URL,
     IAM_URL,
@@ -22,24 +27,27 @@ from yandex_cloud_client.utils.endpoints import (
     RESOURCE_MANAGER_URL,
     CERTIFICATE_DATA_URL
 )
-from yandex_cloud_client.constants import BASE_HEADERS, DEFAULT_TIMEOUT, DEFAULT_OP_TIMEOUT
+from yandex_cloud_client.constants import BASE_HEADERS, DEFAULT_TIMEOUT, DEFAULT_OP_TIMEOUT, DEFAULT_CRAWLER_WORKERS
 from yandex_cloud_client.error import (
     InvalidToken,
     YandexCloudError,
     TooManyArguments,
     BadRequest,
-    MethodNotAvailable
+    MethodNotAvailable,
+    ResourceNotFound
 )
 
 from yandex_cloud_client.cloud import Cloud
 from yandex_cloud_client.folder import Folder, FolderSpec
 
 from yandex_cloud_client.iam.service_account import ServiceAccountAuth
-from yandex_cloud_client.operation import Operation, OperationWait
+from yandex_cloud_client.operation import Operation, OperationWait, OperationPoller, PollingStrategy
 
 from yandex_cloud_client.compute.disk import Disk, DiskSpec, AttachedDiskSpec
 from yandex_cloud_client.compute.instance import Instance, InstanceSpec
-from yandex_cloud_client.compute.snapshot import Snapshot, SnapshotSpec
+from yandex_cloud_client.compute.snapshot import Snapshot, SnapshotSpec, SnapshotIndex
+from yandex_cloud_client.compute.table import InstanceTable, DiskTable, SnapshotTable
+from yandex_cloud_client.compute.crawler import Crawler
 
 from yandex_cloud_client.certificate import Certificate, CertificateRequestSpec, CertificateContent
 
@@ -48,7 +56,6 @@ logger = logging.getLogger(__name__)
 
 # TODO (akimrx): add accessBindings for all clients
 # TODO (akimrx): add update() methods for all resources
-# TODO (akimrx): add pagintaion for list requests
 # TODO (akimrx): add IAM methods to Base Client
 
 
@@ -75,6 +82,12 @@ class YandexCloudClient(YandexCloudObject):
 
     Optional Args:
       request: Request
+      pool_size: int
+      keep_alive: bool
+      polling: PollingStrategy
+      shared_polling: bool
+      json_codec: str ('json', 'orjson') or codec object
+      cache: ResourceCache or True (ResourceCache with the default ttl and size)
       base_url: str
       compute_url: str
       resource_manager_url: str
@@ -86,9 +99,24 @@ class YandexCloudClient(YandexCloudObject):
     Methods:
       operation()                     -> return Operation object
       operation_cancel()              -> return Operation object
+      watch_operation()               -> return Future of completed Operation
+      close()                         -> close pooled connections
+
+    With shared_polling=True all waiters of the client operations
+    are served by the single background poller (see OperationPoller).
+
+    With cache, resources received by id (instance, disk, snapshot, certificate,
+    folder, cloud) are reused until they expire, pass use_cache=False to bypass it.
+
+    The client can be used as a context manager:
+
+      with ComputeClient(oauth_token='...') as compute:
+          compute.instances_in_folder('...')
 
       """
 
+    _request_class = Request
+
     def __init__(self,
                  oauth_token: str = None,
                  iam_token: str = None,
@@ -102,7 +130,13 @@ class YandexCloudClient(YandexCloudObject):
                  certificate_url: str = None,
                  certificate_data_url: str = None,
                  iam_url: str = None,
-                 operation_url: str = None):
+                 operation_url: str = None,
+                 pool_size: int = None,
+                 keep_alive: bool = True,
+                 polling: PollingStrategy = None,
+                 shared_polling: bool = False,
+                 json_codec=None,
+                 cache=None):
 
         _cred_args = [x for x in (service_account_key, oauth_token, iam_token) if x is not None]
         if len(_cred_args) > 1:
@@ -123,12 +157,20 @@ class YandexCloudClient(YandexCloudObject):
 
         self.timeout = int(timeout) if timeout is not None else DEFAULT_TIMEOUT
         self.operation_timeout = int(operation_timeout) if operation_timeout is not None else DEFAULT_OP_TIMEOUT
+        self.polling = polling
+        self.shared_polling = shared_polling
+        self._poller = None
+
+        if cache is True:
+            cache = ResourceCache()
+        self.cache = cache if cache is not False else None
 
         if request:
             self._request = request
             self._request.set_and_return_client(self)
         else:
-            self._request = Request(self, timeout=self.timeout)
+            self._request = self._request_class(self, timeout=self.timeout, pool_size=pool_size,
+                                                keep_alive=keep_alive, codec=json_codec)
 
         self.base_url = base_url or BASE_URL
         self.iam_url = iam_url or IAM_URL
@@ -138,6 +180,19 @@ class YandexCloudClient(YandexCloudObject):
         self.certificate_data_url = certificate_data_url or CERTIFICATE_DATA_URL
         self.operation_url = operation_url or OPERATION_URL
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Stop the shared poller and close pooled connections of the client."""
+        if self._poller is not None:
+            self._poller.stop()
+            self._poller = None
+        self._request.close()
+
     @staticmethod
     def get_iam_token(oauth_token, raw=False) -> [str, dict]:
         """Returns IAM Token for user account."""
@@ -187,44 +242,126 @@ class YandexCloudClient(YandexCloudObject):
 
         return response.get('endpoints')
 
+    @property
+    def poller(self) -> OperationPoller:
+        """Shared background poller of the client operations."""
+        if self._poller is None:
+            self._poller = OperationPoller(self, polling=self.polling, timeout=self.operation_timeout)
+        return self._poller
+
     # Private methods for ComputeClient workflow
 
+    def _fetch_pages(self, url, key, params=None) -> Iterator[list]:
+        params = dict(params or {})
+        while True:
+            response = self._request.get(url, params=params)
+            yield response.get(key) or []
+
+            page_token = response.get('next_page_token')
+            if not page_token:
+                return
+            params['pageToken'] = page_token
+
+    def _iter_pages(self, url, key, params=None, prefetch=0) -> Iterator[list]:
+        """Lazily yields raw resources of each page, following the page tokens.
+        With prefetch > 0, up to `prefetch` next pages are fetched in the background
+        while the current page is processed.
+        """
+        pages = self._fetch_pages(url, key, params=params)
+        if prefetch:
+            return prefetch_iterator(pages, depth=prefetch)
+        return pages
+
+    def _paginate(self, url, key, resource_class, params=None, prefetch=0) -> Iterator[YandexCloudObject]:
+        """Lazily yields resources as objects, only one page (plus prefetched) is kept in memory."""
+        for page in self._iter_pages(url, key, params=params, prefetch=prefetch):
+            yield from resource_class.de_list(page, self)
+
+    def _get_resource(self, resource_type: str, resource_id: str, url: str, use_cache=True) -> dict:
+        """Returns the raw resource, from the cache if it is enabled and use_cache is True.
+        Received resource (or not found error) is put to the cache even if use_cache is False.
+        """
+        if self.cache is not None and use_cache:
+            message = self.cache.get_missing(resource_type, resource_id)
+            if message is not None:
+                raise ResourceNotFound(message)
+
+            response = self.cache.get(resource_type, resource_id)
+            if response is not None:
+                return response
+
+        try:
+            response = self._request.get(url)
+        except ResourceNotFound as e:
+            if self.cache is not None:
+                self.cache.set_missing(resource_type, resource_id, str(e))
+            raise
+
+        if self.cache is not None:
+            self.cache.set(resource_type, resource_id, response)
+        return response
+
+    def _evict_cached(self, operation: Operation) -> Operation:
+        """Removes the resources of the operation (ids in its metadata) from the cache.
+        Called when the operation is started and when it is completed, so the next get reads the changes.
+        """
+        if self.cache is not None and operation is not None and operation.metadata is not None:
+            for resource_type, resource_id in operation.metadata.resource_ids.items():
+                self.cache.invalidate(resource_type, resource_id)
+        return operation
+
+    def _wait_operation(self, operation: Operation) -> Operation:
+        """Sync operation waiter, uses the shared poller if enabled."""
+        if self.shared_polling:
+            return self._evict_cached(self.poller.watch(operation).result())
+
+        waiter = OperationWait(operation, timeout=self.operation_timeout, polling=self.polling)
+        return self._evict_cached(waiter.completed)
+
+    async def _await_operation_async(self, operation: Operation) -> Operation:
+        """Async operation waiter, uses the shared poller if enabled."""
+        if self.shared_polling:
+            return self._evict_cached(await asyncio.wrap_future(self.poller.watch(operation)))
+
+        waiter = OperationWait(operation, timeout=self.operation_timeout, polling=self.polling)
+        return self._evict_cached(await waiter.await_complete_async())
+
     def _delete_resource(self, url, await_complete=None) -> Operation:
         """Wrapper for delete resources."""
         response = self._request.delete(url)
-        operation = Operation.de_json(response, self)
+        operation = self._evict_cached(Operation.de_json(response, self))
         if not await_complete:
             return operation
-        return OperationWait(operation, timeout=self.operation_timeout).completed
+        return self._wait_operation(operation)
 
-    # actually, half-async (because Requests)
     async def _async_delete_resource(self, url) -> CoroutineType:
-        """Half async func for delete resource.
+        """Async func for delete resource,
+        blocking requests are made in the executor.
         Returns coroutine.
         """
-        response = self._request.delete(url)
-        operation = Operation.de_json(response, self)
+        response = await run_blocking(self._request.delete, url)
+        operation = self._evict_cached(Operation.de_json(response, self))
 
-        await OperationWait(operation, timeout=self.operation_timeout).await_complete_async()
+        return await self._await_operation_async(operation)
 
     def _resource_create(self, url, data=None, await_complete=True) -> Operation:
         """Wrapper for create resource."""
         response = self._request.post(url, json=data)
-        operation = Operation.de_json(response, self)
+        operation = self._evict_cached(Operation.de_json(response, self))
 
         if not await_complete:
             return operation
-        return OperationWait(operation, timeout=self.operation_timeout).completed
+        return self._wait_operation(operation)
 
-    # actually, half-async (because Requests)
     async def _async_resource_create(self, url, data=None) -> Operation:
-        """Half async func for create resource.
+        """Async func for create resource,
+        blocking requests are made in the executor.
         Returns coroutine.
         """
-        response = self._request.post(url, json=data)
-        operation = Operation.de_json(response, self)
+        response = await run_blocking(self._request.post, url, json=data)
+        operation = self._evict_cached(Operation.de_json(response, self))
 
-        await OperationWait(operation, timeout=self.operation_timeout).await_complete_async()
+        return await self._await_operation_async(operation)
 
     # Operations public methods
 
@@ -235,6 +372,13 @@ class YandexCloudClient(YandexCloudObject):
         response = self._request.get(url)
         return Operation.de_json(response, self)
 
+    @log
+    def watch_operation(self, operation: Operation, callback=None) -> Future:
+        """Returns future of the completed operation, polled by the shared poller.
+        Callback is called with the future when the operation is done or failed.
+        """
+        return self.poller.watch(operation, callback=callback)
+
     @log
     def cancel_operation(self, operation_id: str) -> Operation:
         """Cancels the operation if possible."""
@@ -246,11 +390,11 @@ class YandexCloudClient(YandexCloudObject):
             raise BadRequest("Operation can't be canceled.")
 
     @log
-    def cloud(self, cloud_id: str) -> Cloud:
+    def cloud(self, cloud_id: str, use_cache=True) -> Cloud:
         """Returns cloud as object."""
         url = f'{self.resource_manager_url}/resource-manager/v1/clouds/{cloud_id}'
 
-        response = self._request.get(url)
+        response = self._get_resource('cloud', cloud_id, url, use_cache=use_cache)
         return Cloud.de_json(response, self)
 
     @log
@@ -259,11 +403,21 @@ class YandexCloudClient(YandexCloudObject):
         url = f'{self.resource_manager_url}/resource-manager/v1/clouds?pageSize={page_size}'
 
         if query_filter:
-            url += f'&filter={query_filter}'
+            url += f'&filter={quote(str(query_filter), safe="")}'
 
         response = self._request.get(url).get('clouds')
         return Cloud.de_list(response, self)
 
+    @log
+    def iter_available_clouds(self, page_size: int = 1000, query_filter: str = None, prefetch=0) -> Iterator[Cloud]:
+        """Lazily yields all available clouds for account, page by page."""
+        url = f'{self.resource_manager_url}/resource-manager/v1/clouds?pageSize={page_size}'
+
+        if query_filter:
+            url += f'&filter={quote(str(query_filter), safe="")}'
+
+        return self._paginate(url, 'clouds', Cloud, prefetch=prefetch)
+
     @log
     def update_cloud(self):
         raise MethodNotAvailable(f'Method update_cloud is not support yet')
@@ -275,6 +429,12 @@ class YandexCloudClient(YandexCloudObject):
         response = self._request.get(url).get('operations')
         return Operation.de_list(response, self)
 
+    @log
+    def iter_cloud_operations(self, cloud_id: str, page_size=1000, prefetch=0) -> Iterator[Operation]:
+        """Lazily yields all operations in the cloud, page by page."""
+        url = f'{self.resource_manager_url}/resource-manager/v1/clouds/{cloud_id}/operations?pageSize={page_size}'
+        return self._paginate(url, 'operations', Operation, prefetch=prefetch)
+
     @log
     def cloud_access_bindings(self):
         raise MethodNotAvailable(f'Method cloud_access_bindings is not support yet')
@@ -288,11 +448,11 @@ class YandexCloudClient(YandexCloudObject):
         raise MethodNotAvailable(f'Method set_cloud_access_bindings is not support yet')
 
     @log
-    def folder(self, folder_id: str) -> Folder:
+    def folder(self, folder_id: str, use_cache=True) -> Folder:
         """Returns folder as object."""
         url = f'{self.resource_manager_url}/resource-manager/v1/folders/{folder_id}'
 
-        response = self._request.get(url)
+        response = self._get_resource('folder', folder_id, url, use_cache=use_cache)
         return Folder.de_json(response, self)
 
     @log
@@ -303,11 +463,22 @@ class YandexCloudClient(YandexCloudObject):
         url = f'{self.resource_manager_url}/resource-manager/v1/folders?cloudId={cloud_id}&pageSize={page_size}'
 
         if query_filter:
-            url += f'&filter={query_filter}'
+            url += f'&filter={quote(str(query_filter), safe="")}'
 
         response = self._request.get(url)
         return Folder.de_list(response.get('folders'), self)
 
+    @log
+    def iter_folders_in_cloud(self, cloud_id: str, page_size: int = 1000,
+                              query_filter: str = None, prefetch=0) -> Iterator[Folder]:
+        """Lazily yields all available folders in the cloud, page by page."""
+        url = f'{self.resource_manager_url}/resource-manager/v1/folders?cloudId={cloud_id}&pageSize={page_size}'
+
+        if query_filter:
+            url += f'&filter={quote(str(query_filter), safe="")}'
+
+        return self._paginate(url, 'folders', Folder, prefetch=prefetch)
+
     @log
     def folder_operations(self, folder_id: str, page_size=1000) -> [Operation]:
         """Returns list of operations in the folder."""
@@ -315,6 +486,12 @@ class YandexCloudClient(YandexCloudObject):
         response = self._request.get(url).get('operations')
         return Operation.de_list(response, self)
 
+    @log
+    def iter_folder_operations(self, folder_id: str, page_size=1000, prefetch=0) -> Iterator[Operation]:
+        """Lazily yields all operations in the folder, page by page."""
+        url = f'{self.resource_manager_url}/resource-manager/v1/folders/{folder_id}/operations?pageSize={page_size}'
+        return self._paginate(url, 'operations', Operation, prefetch=prefetch)
+
     @log
     def folder_access_bindings(self):
         raise MethodNotAvailable(f'Method folder_access_bindings is not support yet')
@@ -398,14 +575,14 @@ class ComputeClient(YandexCloudClient):
 
         url = f'{self.compute_url}/compute/v1/instances/{instance_id}:{action}'
         response = self._request.post(url)
-        operation = Operation.de_json(response, self)
+        operation = self._evict_cached(Operation.de_json(response, self))
         if not await_complete:
             return operation
-        return OperationWait(operation, timeout=self.operation_timeout).completed
+        return self._wait_operation(operation)
 
-    # actually, half-async (because Requests)
     async def _async_instance_state_management(self, action=None, instance_id=None) -> CoroutineType:
-        """Half async helper func for managing the state of the instance.
+        """Async helper func for managing the state of the instance,
+        blocking requests are made in the executor.
         Supported actions: start, restart, stop.
         Returns coroutine.
         """
@@ -415,10 +592,10 @@ class ComputeClient(YandexCloudClient):
             raise TypeError(f'Action {action} not supported')
 
         url = f'{self.compute_url}/compute/v1/instances/{instance_id}:{action}'
-        response = self._request.post(url)
-        operation = Operation.de_json(response, self)
+        response = await run_blocking(self._request.post, url)
+        operation = self._evict_cached(Operation.de_json(response, self))
 
-        await OperationWait(operation, timeout=self.operation_timeout).await_complete_async()
+        return await self._await_operation_async(operation)
 
     def _instance_disk_management(self, instance_id: str, data=None,
                                   action=None, await_complete=True) -> Operation:
@@ -432,15 +609,15 @@ class ComputeClient(YandexCloudClient):
 
         url = f'{self.compute_url}/compute/v1/instances/{instance_id}:{action}'
         response = self._request.post(url, json=data)
-        operation = Operation.de_json(response, self)
+        operation = self._evict_cached(Operation.de_json(response, self))
         if not await_complete:
             return operation
-        return OperationWait(operation, timeout=self.operation_timeout).completed
+        return self._wait_operation(operation)
 
-    # actually, half-async (because Requests)
     async def _async_instance_disk_management(self, instance_id: str,
                                               action=None, data=None) -> Operation:
-        """Half async helper func for managing the state of the disk.
+        """Async helper func for managing the state of the disk,
+        blocking requests are made in the executor.
         Supported actions: detachDisk, attachDisk.
         Returns coroutine.
         """
@@ -450,10 +627,10 @@ class ComputeClient(YandexCloudClient):
             raise TypeError(f'Action {action} not supported')
 
         url = f'{self.compute_url}/compute/v1/instances/{instance_id}:{action}'
-        response = self._request.post(url, json=data)
-        operation = Operation.de_json(response, self)
+        response = await run_blocking(self._request.post, url, json=data)
+        operation = self._evict_cached(Operation.de_json(response, self))
 
-        await OperationWait(operation, timeout=self.operation_timeout).await_complete_async()
+        return await self._await_operation_async(operation)
 
     def _convert_attached_disks(self, disks: list) -> Disk:
         """Helpers func for convert instance attached disks."""
@@ -465,23 +642,52 @@ class ComputeClient(YandexCloudClient):
     # Instance public methods
 
     @log
-    def instance(self, instance_id: str, metadata=False) -> Instance:
-        """Returns instance as object."""
+    def instance(self, instance_id: str, metadata=False, use_cache=True) -> Instance:
+        """Returns instance as object.
+        Only BASIC view is cached, instance with metadata (FULL view) is always requested from the API.
+        """
         url = f'{self.compute_url}/compute/v1/instances/{instance_id}'
-        if metadata:
-            url += '?view=FULL'
 
-        response = self._request.get(url)
+        if metadata:
+            response = self._request.get(url + '?view=FULL')
+        else:
+            response = self._get_resource('instance', instance_id, url, use_cache=use_cache)
         return Instance.de_json(response, self)
 
     @log
-    def instances_in_folder(self, folder_id: str, page_size=1000, query_filter=None) -> [Instance]:
+    def instances_in_folder(self, folder_id: str, page_size=1000, query_filter=None, lazy=False) -> [Instance]:
         """Returns list of instances in the folder."""
         url = f'{self.compute_url}/compute/v1/instances?folderId={folder_id}&pageSize={page_size}'
         if query_filter:
-            url += f'&filter={query_filter}'
+            url += f'&filter={quote(str(query_filter), safe="")}'
         response = self._request.get(url).get('instances')
-        return Instance.de_list(response, self)
+        return Instance.de_list(response, self, lazy=lazy)
+
+    @log
+    def iter_instances_in_folder(self, folder_id: str, page_size=1000,
+                                 query_filter=None, prefetch=0) -> Iterator[Instance]:
+        """Lazily yields all instances in the folder, page by page."""
+        url = f'{self.compute_url}/compute/v1/instances?folderId={folder_id}&pageSize={page_size}'
+        if query_filter:
+            url += f'&filter={quote(str(query_filter), safe="")}'
+        return self._paginate(url, 'instances', Instance, prefetch=prefetch)
+
+    @log
+    def instance_table(self, folder_id: str, page_size=1000, query_filter=None, prefetch=0) -> InstanceTable:
+        """Lists all instances in the folder as InstanceTable, without creating objects."""
+        url = f'{self.compute_url}/compute/v1/instances?folderId={folder_id}&pageSize={page_size}'
+        if query_filter:
+            url += f'&filter={quote(str(query_filter), safe="")}'
+        return InstanceTable.from_pages(self._iter_pages(url, 'instances', prefetch=prefetch))
+
+    @log
+    def crawl(self, cloud_ids: list = None, folder_ids: list = None, resources=('instances',),
+              workers: int = DEFAULT_CRAWLER_WORKERS, page_size=1000, ignore_errors=False) -> Crawler:
+        """Concurrently walks clouds (or folders) and yields (folder_id, resource) as they arrive.
+        Supported resources: instances, disks, snapshots.
+        """
+        return Crawler(self, cloud_ids=cloud_ids, folder_ids=folder_ids, resources=resources,
+                       workers=workers, page_size=page_size, ignore_errors=ignore_errors)
 
     @log
     def instance_serial_port_output(self, instance_id: str, port=1) -> str:
@@ -497,6 +703,12 @@ class ComputeClient(YandexCloudClient):
         response = self._request.get(url).get('operations')
         return Operation.de_list(response, self)
 
+    @log
+    def iter_instance_operations(self, instance_id: str, page_size=1000, prefetch=0) -> Iterator[Operation]:
+        """Lazily yields all instance operations, page by page."""
+        url = f'{self.compute_url}/compute/v1/instances/{instance_id}/operations?pageSize={page_size}'
+        return self._paginate(url, 'operations', Operation, prefetch=prefetch)
+
     @log
     def instance_attach_existent_disk(self, instance_id: str, disk_id: str, mode='READ_WRITE',
                                       device_name=None, auto_delete=False, await_complete=True,
@@ -639,10 +851,10 @@ class ComputeClient(YandexCloudClient):
     # Disks public methods
 
     @log
-    def disk(self, disk_id: str, raw=False) -> Disk:
+    def disk(self, disk_id: str, raw=False, use_cache=True) -> Disk:
         """Returns a disk as object."""
         url = f'{self.compute_url}/compute/v1/disks/{disk_id}'
-        response = self._request.get(url)
+        response = self._get_resource('disk', disk_id, url, use_cache=use_cache)
         if raw:
             return response
         return Disk.de_json(response, self)
@@ -655,13 +867,35 @@ class ComputeClient(YandexCloudClient):
         return Operation.de_list(response, self)
 
     @log
-    def disks_in_folder(self, folder_id: str, page_size=1000, query_filter=None) -> [Disk]:
+    def iter_disk_operations(self, disk_id: str, page_size=1000, prefetch=0) -> Iterator[Operation]:
+        """Lazily yields all disk operations, page by page."""
+        url = f'{self.compute_url}/compute/v1/disks/{disk_id}/operations?pageSize={page_size}'
+        return self._paginate(url, 'operations', Operation, prefetch=prefetch)
+
+    @log
+    def disks_in_folder(self, folder_id: str, page_size=1000, query_filter=None, lazy=False) -> [Disk]:
         """Return list of the disks in a folder."""
         url = f'{self.compute_url}/compute/v1/disks?folderId={folder_id}&pageSize={page_size}'
         if query_filter:
-            url += f'&filter={query_filter}'
+            url += f'&filter={quote(str(query_filter), safe="")}'
         response = self._request.get(url).get('disks')
-        return Disk.de_list(response, self)
+        return Disk.de_list(response, self, lazy=lazy)
+
+    @log
+    def iter_disks_in_folder(self, folder_id: str, page_size=1000, query_filter=None, prefetch=0) -> Iterator[Disk]:
+        """Lazily yields all disks in the folder, page by page."""
+        url = f'{self.compute_url}/compute/v1/disks?folderId={folder_id}&pageSize={page_size}'
+        if query_filter:
+            url += f'&filter={quote(str(query_filter), safe="")}'
+        return self._paginate(url, 'disks', Disk, prefetch=prefetch)
+
+    @log
+    def disk_table(self, folder_id: str, page_size=1000, query_filter=None, prefetch=0) -> DiskTable:
+        """Lists all disks in the folder as DiskTable, without creating objects."""
+        url = f'{self.compute_url}/compute/v1/disks?folderId={folder_id}&pageSize={page_size}'
+        if query_filter:
+            url += f'&filter={quote(str(query_filter), safe="")}'
+        return DiskTable.from_pages(self._iter_pages(url, 'disks', prefetch=prefetch))
 
     @log
     def delete_disk(self, disk_id: str, await_complete=True, run_async_await=False) -> Operation:
@@ -695,10 +929,10 @@ class ComputeClient(YandexCloudClient):
     # Snapshots public methods
 
     @log
-    def snapshot(self, snapshot_id: str) -> Snapshot:
+    def snapshot(self, snapshot_id: str, use_cache=True) -> Snapshot:
         """Returns the snapshot as object."""
         url = f'{self.compute_url}/compute/v1/snapshots/{snapshot_id}'
-        response = self._request.get(url)
+        response = self._get_resource('snapshot', snapshot_id, url, use_cache=use_cache)
         return Snapshot.de_json(response, self)
 
     @log
@@ -709,13 +943,43 @@ class ComputeClient(YandexCloudClient):
         return Operation.de_list(response, self)
 
     @log
-    def snapshots_in_folder(self, folder_id: str, page_size=1000, query_filter=None) -> [Snapshot]:
+    def iter_snapshot_operations(self, snapshot_id: str, page_size=1000, prefetch=0) -> Iterator[Operation]:
+        """Lazily yields all snapshot operations, page by page."""
+        url = f'{self.compute_url}/compute/v1/snapshots/{snapshot_id}/operations?pageSize={page_size}'
+        return self._paginate(url, 'operations', Operation, prefetch=prefetch)
+
+    @log
+    def snapshots_in_folder(self, folder_id: str, page_size=1000, query_filter=None, lazy=False) -> [Snapshot]:
         """Returns list of the snapshots in a folder."""
         url = f'{self.compute_url}/compute/v1/snapshots?folderId={folder_id}&pageSize={page_size}'
         if query_filter:
-            url += f'&filter={query_filter}'
+            url += f'&filter={quote(str(query_filter), safe="")}'
         response = self._request.get(url).get('snapshots')
-        return Snapshot.de_list(response, self)
+        return Snapshot.de_list(response, self, lazy=lazy)
+
+    @log
+    def iter_snapshots_in_folder(self, folder_id: str, page_size=1000,
+                                 query_filter=None, prefetch=0) -> Iterator[Snapshot]:
+        """Lazily yields all snapshots in the folder, page by page."""
+        url = f'{self.compute_url}/compute/v1/snapshots?folderId={folder_id}&pageSize={page_size}'
+        if query_filter:
+            url += f'&filter={quote(str(query_filter), safe="")}'
+        return self._paginate(url, 'snapshots', Snapshot, prefetch=prefetch)
+
+    @log
+    def snapshot_index(self, folder_id: str, page_size=1000, query_filter=None, prefetch=0) -> SnapshotIndex:
+        """Lists all snapshots in the folder once and returns them grouped by source disk."""
+        snapshots = self.iter_snapshots_in_folder(folder_id, page_size=page_size,
+                                                  query_filter=query_filter, prefetch=prefetch)
+        return SnapshotIndex(snapshots, folder_id=folder_id)
+
+    @log
+    def snapshot_table(self, folder_id: str, page_size=1000, query_filter=None, prefetch=0) -> SnapshotTable:
+        """Lists all snapshots in the folder as SnapshotTable, without creating objects."""
+        url = f'{self.compute_url}/compute/v1/snapshots?folderId={folder_id}&pageSize={page_size}'
+        if query_filter:
+            url += f'&filter={quote(str(query_filter), safe="")}'
+        return SnapshotTable.from_pages(self._iter_pages(url, 'snapshots', prefetch=prefetch))
 
     @log
     def create_snapshot(self, folder_id: str, disk_id: str, name=None, description=None,
@@ -798,14 +1062,18 @@ class CertificateClient(YandexCloudClient):
     """
 
     @log
-    def certificate(self, certificate_id: str, view="FULL") -> Certificate:
+    def certificate(self, certificate_id: str, view="FULL", use_cache=True) -> Certificate:
         """Return certificate:
         BASIC - short info,
         FULL - full info with challenges.
+        Only FULL view is cached.
         """
         url = f'{self.certificate_url}/certificate-manager/v1/certificates/{certificate_id}?view={view}'
 
-        response = self._request.get(url)
+        if view == 'FULL':
+            response = self._get_resource('certificate', certificate_id, url, use_cache=use_cache)
+        else:
+            response = self._request.get(url)
         return Certificate.de_json(response, self)
 
     @log
@@ -829,19 +1097,40 @@ class CertificateClient(YandexCloudClient):
 
         url = f'{self.certificate_url}/certificate-manager/v1/certificates?folderId={folder_id}&pageSize={page_size}&view={view}'
         if query_filter:
-            url += f'&filter={query_filter}'
+            url += f'&filter={quote(str(query_filter), safe="")}'
         response = self._request.get(url).get('certificates')
         return Certificate.de_list(response, self)
 
+    @log
+    def iter_certificates_in_folder(self,
+                                    folder_id: str,
+                                    page_size=1000,
+                                    query_filter=None,
+                                    view="BASIC", prefetch=0) -> Iterator[Certificate]:
+        """Lazily yields all certificates in the folder, page by page."""
+        url = (f'{self.certificate_url}/certificate-manager/v1/certificates'
+               f'?folderId={folder_id}&pageSize={page_size}&view={view}')
+        if query_filter:
+            url += f'&filter={quote(str(query_filter), safe="")}'
+        return self._paginate(url, 'certificates', Certificate, prefetch=prefetch)
+
     @log
     def certificate_operations(self,
                                certificate_id: str,
                                page_size=1000) -> [Operation]:
         """Returns list of certificate operations."""
-        url = f'{self.compute_url}/certificate-manager/v1/certificates{certificate_id}/operations?pageSize={page_size}'
+        url = (f'{self.certificate_url}/certificate-manager/v1/certificates/{certificate_id}/operations'
+               f'?pageSize={page_size}')
         response = self._request.get(url).get('operations')
         return Operation.de_list(response, self)
 
+    @log
+    def iter_certificate_operations(self, certificate_id: str, page_size=1000, prefetch=0) -> Iterator[Operation]:
+        """Lazily yields all certificate operations, page by page."""
+        url = (f'{self.certificate_url}/certificate-manager/v1/certificates/{certificate_id}/operations'
+               f'?pageSize={page_size}')
+        return self._paginate(url, 'operations', Operation, prefetch=prefetch)
+
     @log
     def create_user_certificate(self):
         raise MethodNotAvailable(f'Method create_user_certificate is not support yet')
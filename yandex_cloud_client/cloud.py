@@ -3,12 +3,22 @@
 """This module contains Cloud class."""
 
 from yandex_cloud_client.base import YandexCloudObject
+from yandex_cloud_client.utils.fields import Field
 from yandex_cloud_client.utils.helpers import string_to_datetime
 
 
 class Cloud(YandexCloudObject):
     """This object represents a Cloud."""
 
+    __slots__ = ('id', 'created_at', 'name', 'description', 'client')
+    _id_fields = ('id',)
+    _field_table = (
+        Field('id'),
+        Field('created_at', string_to_datetime),
+        Field('name'),
+        Field('description'),
+    )
+
     def __init__(self,
                  id=None,
                  created_at=None,
@@ -25,7 +35,6 @@ class Cloud(YandexCloudObject):
         self.description = description
 
         self.client = client
-        self._id_attrs = (self.id,)
 
     def add_folder(self, *args, **kwargs):
         """Shortcut for client.create_folder()."""
@@ -50,22 +59,3 @@ class Cloud(YandexCloudObject):
 
     def update_access_bindings(self):
         pass
-
-    @classmethod
-    def de_json(cls, data: dict, client):
-        if not data:
-            return None
-
-        data = super(Cloud, cls).de_json(data, client)
-        return cls(client=client, **data)
-
-    @classmethod
-    def de_list(cls, data: list, client):
-        if not data:
-            return []
-
-        clouds = list()
-        for cloud in data:
-            clouds.append(cls.de_json(cloud, client))
-
-        return clouds
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""This module contains Crawler class."""
+
+import logging
+import threading
+
+from queue import Queue, Full
+from concurrent.futures import ThreadPoolExecutor
+
+from yandex_cloud_client.constants import DEFAULT_CRAWLER_WORKERS, CRAWLER_QUEUE_PER_WORKER
+
+logger = logging.getLogger(__name__)
+
+
+class Crawler:
+    """This class represents a concurrent walker over clouds and folders.
+
+    Folders of the clouds and resources of the folders are listed
+    by `workers` threads at the same time, resources are yielded
+    as `(folder_id, resource)` tuples as soon as they arrive.
+    Workers pause when CRAWLER_QUEUE_PER_WORKER resources per worker
+    are waiting to be consumed.
+
+    Usually, you don't need to create it, use client.crawl().
+
+    Example:
+      for folder_id, instance in compute.crawl(cloud_ids=['b1g...'], resources=('instances',)):
+          print(folder_id, instance.name)
+
+    If ignore_errors is True, failed folders don't stop the crawl,
+    their errors are collected in `errors` by folder (or cloud) id,
+    every iteration starts with empty `errors`.
+
+    """
+
+    RESOURCES = {
+        'instances': 'iter_instances_in_folder',
+        'disks': 'iter_disks_in_folder',
+        'snapshots': 'iter_snapshots_in_folder',
+    }
+
+    _FOLDER = 'folder'
+    _RESOURCE = 'resource'
+    _ERROR = 'error'
+    _DONE = 'done'
+
+    def __init__(self, client, cloud_ids=None, folder_ids=None, resources=('instances',),
+                 workers=DEFAULT_CRAWLER_WORKERS, page_size=1000, ignore_errors=False):
+
+        unknown = [x for x in resources if x not in self.RESOURCES]
+        if unknown:
+            raise ValueError(f'Unsupported resources: {unknown}. Supported: {tuple(self.RESOURCES)}')
+
+        self._client = client
+        self._cloud_ids = list(cloud_ids) if cloud_ids is not None else None
+        self._folder_ids = list(folder_ids) if folder_ids is not None else None
+        self._resources = tuple(resources)
+        self._workers = int(workers)
+        self._page_size = page_size
+        self._ignore_errors = ignore_errors
+
+        self._queue = None
+        self._stopped = None
+
+        self.errors = {}
+
+    def __iter__(self):
+        self._queue = Queue(maxsize=self._workers * CRAWLER_QUEUE_PER_WORKER)
+        self._stopped = threading.Event()
+        self.errors = {}
+        executor = ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix='yc-crawler')
+        futures = []
+        pending = 0
+
+        def submit(func, *args):
+            nonlocal pending
+            pending += 1
+            futures.append(executor.submit(self._job, func, *args))
+
+        try:
+            if self._folder_ids is not None:
+                for folder_id in self._folder_ids:
+                    for resource in self._resources:
+                        submit(self._list_resources, folder_id, resource)
+            else:
+                cloud_ids = self._cloud_ids
+                if cloud_ids is None:
+                    cloud_ids = [cloud.id for cloud in self._client.iter_available_clouds()]
+                for cloud_id in cloud_ids:
+                    submit(self._list_folders, cloud_id)
+
+            while pending:
+                kind, key, value = self._queue.get()
+
+                if kind == self._RESOURCE:
+                    yield key, value
+                elif kind == self._FOLDER:
+                    for resource in self._resources:
+                        submit(self._list_resources, value, resource)
+                elif kind == self._ERROR:
+                    if not self._ignore_errors:
+                        raise value
+                    logger.warning(f'Crawling of {key} failed: {value}')
+                    self.errors[key] = value
+                elif kind == self._DONE:
+                    pending -= 1
+        finally:
+            self._stopped.set()
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def _put(self, kind, key, value=None) -> bool:
+        while not self._stopped.is_set():
+            try:
+                self._queue.put((kind, key, value), timeout=0.1)
+                return True
+            except Full:
+                continue
+        return False
+
+    def _job(self, func, *args):
+        try:
+            func(*args)
+        except Exception as err:
+            self._put(self._ERROR, args[0], err)
+        finally:
+            self._put(self._DONE, args[0])
+
+    def _list_folders(self, cloud_id: str):
+        for folder in self._client.iter_folders_in_cloud(cloud_id, page_size=self._page_size):
+            if not self._put(self._FOLDER, cloud_id, folder.id):
+                return
+
+    def _list_resources(self, folder_id: str, resource: str):
+        iterator = getattr(self._client, self.RESOURCES[resource])
+        for item in iterator(folder_id, page_size=self._page_size):
+            if not self._put(self._RESOURCE, folder_id, item):
+                return
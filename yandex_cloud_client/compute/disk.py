@@ -2,16 +2,42 @@
 # -*- coding: utf-8 -*-
 """This module contains Disk, AttachedDisk, AttachedDiskSpec and DiskSpec classes."""
 
+import inspect
 import logging
 
 from yandex_cloud_client.constants import MIN_DISK_SIZE, MAX_DISK_SIZE, DISK_MODES
 from yandex_cloud_client.base import YandexCloudObject
+from yandex_cloud_client.utils.fields import Field
 from yandex_cloud_client.error import TooManyArguments
+from yandex_cloud_client.utils.filters import QueryFilter
 from yandex_cloud_client.utils.helpers import human_readable_size, string_to_datetime, disk_mode_converter
 
 logger = logging.getLogger(__name__)
 
 
+def _filter_disk_snapshots(disk_id, snapshots):
+    return [snapshot for snapshot in snapshots if disk_id == snapshot.source_disk_id]
+
+
+def _disk_snapshots(disk_id, snapshots):
+    """Returns snapshots of the disk, or a coroutine of them if the async client returned an awaitable."""
+    if inspect.isawaitable(snapshots):
+        async def _await_snapshots():
+            return _filter_disk_snapshots(disk_id, await snapshots)
+        return _await_snapshots()
+    return _filter_disk_snapshots(disk_id, snapshots)
+
+
+def _indexed_disk_snapshots(disk_id, folder_id, index, query_filter=None):
+    """Returns snapshots of the disk from SnapshotIndex of its folder."""
+    if query_filter:
+        raise TooManyArguments('query_filter and index received, apply the filter when building the index')
+    if index.folder_id is not None and index.folder_id != folder_id:
+        raise ValueError(f'Index of the folder {index.folder_id} can not be used for disk {disk_id} '
+                         f'in the folder {folder_id}')
+    return index.snapshots(disk_id)
+
+
 class Disk(YandexCloudObject):
     """This class representing a disk as an independent object.
 
@@ -36,6 +62,28 @@ class Disk(YandexCloudObject):
 
     """
 
+    __slots__ = (
+        'id', 'folder_id', 'created_at', 'name', 'description', 'labels', 'type_id', 'zone_id', 'size',
+        'product_ids', 'status', 'instance_ids', 'source_image_id', 'source_snapshot_id', 'client'
+    )
+    _id_fields = ('id',)
+    _field_table = (
+        Field('id'),
+        Field('folder_id'),
+        Field('created_at', string_to_datetime),
+        Field('name'),
+        Field('description'),
+        Field('labels', default=dict),
+        Field('type_id'),
+        Field('zone_id'),
+        Field('size', int),
+        Field('product_ids'),
+        Field('status'),
+        Field('instance_ids'),
+        Field('source_image_id'),
+        Field('source_snapshot_id'),
+    )
+
     def __init__(self,
                  id=None,
                  folder_id=None,
@@ -75,7 +123,6 @@ class Disk(YandexCloudObject):
         self.source_snapshot_id = source_snapshot_id
 
         self.client = client
-        self._id_attrs = (self.id,)
 
     @property
     def human_readable_size(self):
@@ -96,38 +143,21 @@ class Disk(YandexCloudObject):
         """Shortcut for client.disk_operations()."""
         return self.client.disk_operations(self.id, *args, **kwargs)
 
-    def snapshots(self, *args, **kwargs):
-        """Shortcut for client.snapshots_in_folder()."""
-        result = list()
-        snapshots = self.client.snapshots_in_folder(self.folder_id, *args, **kwargs)
-        for snapshot in snapshots:
-            if self.id == snapshot.source_disk_id:
-                result.append(snapshot)
-        return result
+    def snapshots(self, page_size=1000, query_filter=None, index=None):
+        """Shortcut for client.snapshots_in_folder(), filtered by the disk on the API side.
+        If index (SnapshotIndex of the folder) passed, snapshots are taken from it without API calls.
+        """
+        if index is not None:
+            return _indexed_disk_snapshots(self.id, self.folder_id, index, query_filter)
+
+        query_filter = QueryFilter(query_filter).source_disk_id(self.id)
+        snapshots = self.client.snapshots_in_folder(self.folder_id, page_size=page_size, query_filter=query_filter)
+        return _disk_snapshots(self.id, snapshots)
 
     def create_snapshot(self, *args, **kwargs):
         """Shortcut for client.create_snapshot()."""
         return self.client.create_snapshot(self.folder_id, self.id, *args, **kwargs)
 
-    @classmethod
-    def de_json(cls, data: dict, client):
-        if not data:
-            return None
-
-        data = super(Disk, cls).de_json(data, client)
-        return cls(client=client, **data)
-
-    @classmethod
-    def de_list(cls, data: list, client):
-        if not data:
-            return []
-
-        disks = list()
-        for disk in data:
-            disks.append(cls.de_json(disk, client))
-
-        return disks
-
 
 class AttachedDisk(YandexCloudObject):
     """This object represents a attached to the instance disk.
@@ -145,6 +175,18 @@ class AttachedDisk(YandexCloudObject):
 
     """
 
+    __slots__ = ('id', 'disk_id', 'folder_id', 'attached_to', 'mode', 'device_name', 'auto_delete', 'client')
+    _id_fields = ('id',)
+    _field_table = (
+        Field('id', key='disk_id'),
+        Field('disk_id'),
+        Field('folder_id'),
+        Field('attached_to'),
+        Field('mode'),
+        Field('device_name'),
+        Field('auto_delete'),
+    )
+
     def __init__(self,
                  disk_id=None,
                  attached_to=None,
@@ -169,12 +211,10 @@ class AttachedDisk(YandexCloudObject):
         self.auto_delete = auto_delete
 
         self.client = client
-        self._id_attrs = (self.id,)
 
-    def detach(self, await_complete=True, run_async_await=False, *args, **kwargs):
+    def detach(self, *args, **kwargs):
         """Shortcut for client.instance_detach_disk()."""
-        return self.client.instance_detach_disk(self.attached_to, disk_id=self.id,
-            await_complete=await_complete, run_async_await=run_async_await, *args, **kwargs)
+        return self.client.instance_detach_disk(self.attached_to, disk_id=self.id, *args, **kwargs)
 
     def delete(self, *args, **kwargs):
         """Shortcut for client.delete_disk()."""
@@ -188,40 +228,20 @@ class AttachedDisk(YandexCloudObject):
         """Shortcut for client.disk_operarions()."""
         return self.client.disk_operations(self.id, page_size=page_size, *args, **kwargs)
 
-    def snapshots(self, query_filter=None, *args, **kwargs):
-        """Shortcut for client.snapshots_in_folder()."""
-        result = list()
-        snapshots = self.client.snapshots_in_folder(self.folder_id, page_size=1000,
-            query_filter=query_filter, *args, **kwargs)
-        for snapshot in snapshots:
-            if self.id == snapshot.source_disk_id:
-                result.append(snapshot)
-        return result
+    def snapshots(self, query_filter=None, page_size=1000, index=None):
+        """Shortcut for client.snapshots_in_folder(), filtered by the disk on the API side.
+        If index (SnapshotIndex of the folder) passed, snapshots are taken from it without API calls.
+        """
+        if index is not None:
+            return _indexed_disk_snapshots(self.id, self.folder_id, index, query_filter)
 
-    def create_snapshot(self, name=None, description=None, labels=None, await_complete=True,
-                        run_async_await=False, *args, **kwargs):
-        """Shortcut for client.create_snapshot()."""
-        return self.client.create_snapshot(self.folder_id, self.id, name=name, description=description, labels=labels,
-            await_complete=await_complete, run_async_await=run_async_await, *args, **kwargs)
-
-    @classmethod
-    def de_json(cls, data: dict, client):
-        if not data:
-            return None
+        query_filter = QueryFilter(query_filter).source_disk_id(self.id)
+        snapshots = self.client.snapshots_in_folder(self.folder_id, page_size=page_size, query_filter=query_filter)
+        return _disk_snapshots(self.id, snapshots)
 
-        data = super(AttachedDisk, cls).de_json(data, client)
-        return cls(client=client, **data)
-
-    @classmethod
-    def de_list(cls, data: list, client):
-        if not data:
-            return []
-
-        disks = list()
-        for disk in data:
-            disks.append(cls.de_json(disk, client))
-
-        return disks
+    def create_snapshot(self, *args, **kwargs):
+        """Shortcut for client.create_snapshot()."""
+        return self.client.create_snapshot(self.folder_id, self.id, *args, **kwargs)
 
 
 # Specifications for disks
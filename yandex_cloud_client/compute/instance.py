@@ -4,8 +4,9 @@
 
 import logging
 
-from yandex_cloud_client.utils.helpers import universal_obj_hook, human_readable_size, string_to_datetime
+from yandex_cloud_client.utils.helpers import human_readable_size, string_to_datetime
 from yandex_cloud_client.base import YandexCloudObject
+from yandex_cloud_client.utils.fields import Field
 from yandex_cloud_client.compute.disk import AttachedDisk, DiskSpec
 from yandex_cloud_client.vpc.network_interface import NetworkInterface
 from yandex_cloud_client.error import TooManyArguments
@@ -57,6 +58,34 @@ class Instance(YandexCloudObject):
 
     """
 
+    __slots__ = (
+        'id', 'folder_id', 'created_at', 'name', 'description', 'labels', 'zone_id', 'platform_id',
+        'resources', 'status', 'metadata', 'boot_disk', 'secondary_disks', 'network_interfaces', 'fqdn',
+        'scheduling_policy', 'service_account_id', 'network_settings', 'client'
+    )
+    _id_fields = ('id',)
+    _field_table = (
+        Field('id'),
+        Field('folder_id'),
+        Field('created_at', string_to_datetime),
+        Field('name'),
+        Field('description'),
+        Field('labels', default=dict),
+        Field('zone_id'),
+        Field('platform_id'),
+        Field('resources', nested='Resources'),
+        Field('status'),
+        Field('metadata', nested='Metadata'),
+        Field('boot_disk', nested=AttachedDisk, parent={'attached_to': 'id', 'folder_id': 'folder_id'}),
+        Field('secondary_disks', nested=AttachedDisk, many=True,
+              parent={'attached_to': 'id', 'folder_id': 'folder_id'}),
+        Field('network_interfaces', nested=NetworkInterface, many=True),
+        Field('fqdn'),
+        Field('scheduling_policy', nested='SchedulingPolicy'),
+        Field('service_account_id'),
+        Field('network_settings', nested='NetworkSettings'),
+    )
+
     def __init__(self,
                  id=None,
                  folder_id=None,
@@ -104,7 +133,6 @@ class Instance(YandexCloudObject):
         self.network_settings = network_settings
 
         self.client = client
-        self._id_attrs = (self.id,)
 
     @property
     def running(self):
@@ -130,42 +158,6 @@ class Instance(YandexCloudObject):
             return True
         return False
 
-    @classmethod
-    def de_json(cls, data: dict, client):
-        if not data:
-            return None
-
-        data = super(Instance, cls).de_json(data, client)
-        data['boot_disk'].update({'attached_to': data.get('id', None)})
-        data['boot_disk'].update({'folder_id': data.get('folder_id', None)})
-        data['boot_disk'] = AttachedDisk.de_json(universal_obj_hook(data.get('boot_disk')), client)
-
-        # add folder id and source instance id as attr to disks
-        for disk in data.get('secondary_disks', []):
-            if disk is not None:
-                disk.update({'attached_to': data.get('id', None)})
-                disk.update({'folder_id': data.get('folder_id', None)})
-
-        data['secondary_disks'] = AttachedDisk.de_list(universal_obj_hook(data.get('secondary_disks')), client)
-        data['network_interfaces'] = NetworkInterface.de_list(universal_obj_hook(data.get('network_interfaces')), client)
-        data['resources'] = Resources.de_json(universal_obj_hook(data.get('resources')), client)
-        data['metadata'] = Metadata.de_json(universal_obj_hook(data.get('metadata')), client)
-        data['scheduling_policy'] = SchedulingPolicy.de_json(universal_obj_hook(data.get('scheduling_policy')), client)
-        data['network_settings'] = NetworkSettings.de_json(universal_obj_hook(data.get('network_settings')), client)
-
-        return cls(client=client, **data)
-
-    @classmethod
-    def de_list(cls, data: list, client):
-        if not data:
-            return []
-
-        instances = list()
-        for instance in data:
-            instances.append(cls.de_json(instance, client))
-
-        return instances
-
     def start(self, *args, **kwargs):
         """Shortcut for client.start_instance()."""
         return self.client.start_instance(self.id, *args, **kwargs)
@@ -231,6 +223,14 @@ class Instance(YandexCloudObject):
 class Metadata(YandexCloudObject):
     """This object represents a metadata of instance."""
 
+    __slots__ = ('user_data', 'serial_port_enable', 'ssh_keys', 'client')
+    _id_fields = ('user_data', 'serial_port_enable', 'ssh_keys')
+    _field_table = (
+        Field('user_data'),
+        Field('serial_port_enable', lambda value: bool(int(value))),
+        Field('ssh_keys'),
+    )
+
     def __init__(self,
                  user_data=None,
                  serial_port_enable=None,
@@ -245,20 +245,17 @@ class Metadata(YandexCloudObject):
         self.ssh_keys = ssh_keys
 
         self.client = client
-        self._id_attrs = (self.user_data, self.serial_port_enable, self.ssh_keys)
-
-    @classmethod
-    def de_json(cls, data: dict, client):
-        if not data:
-            return None
-
-        data = super(Metadata, cls).de_json(data, client)
-        return cls(client=client, **data)
 
 
 class SchedulingPolicy(YandexCloudObject):
     """This object represents a sheduling policy options of instance."""
 
+    __slots__ = ('preemptible', 'client')
+    _id_fields = ('preemptible',)
+    _field_table = (
+        Field('preemptible', bool, always=True),
+    )
+
     def __init__(self,
                  preemptible=None,
                  client=None,
@@ -268,20 +265,20 @@ class SchedulingPolicy(YandexCloudObject):
 
         self.preemptible = bool(preemptible)
         self.client = client
-        self._id_attrs = (self.preemptible,)
-
-    @classmethod
-    def de_json(cls, data: dict, client):
-        if not data:
-            return None
-
-        data = super(SchedulingPolicy, cls).de_json(data, client)
-        return cls(client=client, **data)
 
 
 class Resources(YandexCloudObject):
     """This object represents a resources of instance."""
 
+    __slots__ = ('memory', 'cores', 'core_fraction', 'gpus', 'client')
+    _id_fields = ('memory', 'cores', 'core_fraction', 'gpus')
+    _field_table = (
+        Field('memory', int),
+        Field('cores', int),
+        Field('core_fraction', int),
+        Field('gpus', int),
+    )
+
     def __init__(self, memory=None, cores=None, core_fraction=None,
                  gpus=None, client=None, **kwargs):
 
@@ -293,7 +290,6 @@ class Resources(YandexCloudObject):
         self.gpus = int(gpus) if gpus is not None else gpus
 
         self.client = client
-        self._id_attrs = (self.memory, self.cores, self.core_fraction, self.gpus)
 
     @property
     def human_readable_memory(self):
@@ -301,18 +297,16 @@ class Resources(YandexCloudObject):
             return human_readable_size(self.memory)
         return self.memory
 
-    @classmethod
-    def de_json(cls, data: dict, client):
-        if not data:
-            return None
-
-        data = super(Resources, cls).de_json(data, client)
-        return cls(client=client, **data)
-
 
 class NetworkSettings(YandexCloudObject):
     """This object represents a network settings of instance."""
 
+    __slots__ = ('type', 'client')
+    _id_fields = ('type',)
+    _field_table = (
+        Field('type'),
+    )
+
     def __init__(self,
                  type=None,
                  client=None,
@@ -322,15 +316,6 @@ class NetworkSettings(YandexCloudObject):
 
         self.type = type
         self.client = client
-        self._id_attrs = (self.type,)
-
-    @classmethod
-    def de_json(cls, data: dict, client):
-        if not data:
-            return None
-
-        data = super(NetworkSettings, cls).de_json(data, client)
-        return cls(client=client, **data)
 
 
 # Specifications for new instances
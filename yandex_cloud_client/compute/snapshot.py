@@ -1,12 +1,13 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
-"""This module contains Snapshot class."""
+"""This module contains Snapshot, SnapshotIndex and SnapshotSpec classes."""
 
 from datetime import datetime
 
 from yandex_cloud_client.constants import SECONDS_IN_DAY
 from yandex_cloud_client.utils.helpers import string_to_datetime, human_readable_size
 from yandex_cloud_client.base import YandexCloudObject
+from yandex_cloud_client.utils.fields import Field
 
 
 class Snapshot(YandexCloudObject):
@@ -28,6 +29,25 @@ class Snapshot(YandexCloudObject):
 
     """
 
+    __slots__ = (
+        'id', 'folder_id', 'created_at', 'name', 'description', 'labels', 'storage_size', 'disk_size',
+        'product_ids', 'status', 'source_disk_id', 'client'
+    )
+    _id_fields = ('id',)
+    _field_table = (
+        Field('id'),
+        Field('folder_id'),
+        Field('created_at', string_to_datetime),
+        Field('name'),
+        Field('description'),
+        Field('labels', default=dict),
+        Field('storage_size', int),
+        Field('disk_size', int),
+        Field('product_ids'),
+        Field('status'),
+        Field('source_disk_id'),
+    )
+
     def __init__(self,
                  id=None,
                  folder_id=None,
@@ -61,7 +81,6 @@ class Snapshot(YandexCloudObject):
         self.source_disk_id = source_disk_id
 
         self.client = client
-        self._id_attrs = (self.id,)
 
     @property
     def age(self):
@@ -98,25 +117,63 @@ class Snapshot(YandexCloudObject):
         """Shortcut for snapshot_operations()."""
         return self.client.snapshot_operations(self.id, *args, **kwargs)
 
-    @classmethod
-    def de_json(cls, data: dict, client):
-        if not data:
-            return None
 
-        data = super(Snapshot, cls).de_json(data, client)
-        return cls(client=client, **data)
+class SnapshotIndex:
+    """This object represents snapshots of a folder grouped by the source disk.
 
-    @classmethod
-    def de_list(cls, data: list, client):
-        if not data:
-            return []
+    Snapshots of each disk are sorted by created_at (oldest first).
+    Build it once per folder with client.snapshot_index() and pass it
+    to Disk.snapshots(index=...) to avoid listing the folder for every disk.
+
+    Attributes:
+      :folder_id: str
+      :disk_ids: list
+
+    """
 
-        snapshots = list()
-        for snapshot in data:
-            snapshots.append(cls.de_json(snapshot, client))
+    def __init__(self, snapshots=None, folder_id=None):
+        self.folder_id = folder_id
+        self._by_disk = {}
+
+        for snapshot in snapshots or ():
+            self._by_disk.setdefault(snapshot.source_disk_id, []).append(snapshot)
+
+        for disk_snapshots in self._by_disk.values():
+            disk_snapshots.sort(key=self._created_at)
+
+    @staticmethod
+    def _created_at(snapshot):
+        return snapshot.created_at if isinstance(snapshot.created_at, datetime) else datetime.min
+
+    def __contains__(self, disk_id):
+        return disk_id in self._by_disk
+
+    def __getitem__(self, disk_id):
+        return self.snapshots(disk_id)
+
+    def __iter__(self):
+        for disk_snapshots in self._by_disk.values():
+            yield from disk_snapshots
+
+    def __len__(self):
+        return sum(len(x) for x in self._by_disk.values())
+
+    def __repr__(self):
+        return (f'{self.__class__.__name__}(folder_id={self.folder_id!r}, '
+                f'disks={len(self._by_disk)}, snapshots={len(self)})')
+
+    @property
+    def disk_ids(self):
+        return list(self._by_disk)
 
-        return snapshots
+    def snapshots(self, disk_id: str) -> [Snapshot]:
+        """Returns snapshots of the disk sorted by created_at."""
+        return list(self._by_disk.get(disk_id, ()))
 
+    def latest(self, disk_id: str):
+        """Returns the newest snapshot of the disk or None."""
+        disk_snapshots = self._by_disk.get(disk_id)
+        return disk_snapshots[-1] if disk_snapshots else None
 
 
 class SnapshotSpec(YandexCloudObject):
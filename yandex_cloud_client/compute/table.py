@@ -0,0 +1,375 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""This module contains ResourceTable, InstanceTable, DiskTable and SnapshotTable classes."""
+
+import logging
+
+from datetime import datetime
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from yandex_cloud_client.base import LazyList
+from yandex_cloud_client.utils.helpers import string_to_datetime
+
+logger = logging.getLogger(__name__)
+
+
+def _utc_seconds(value) -> str:
+    """RFC 3339 timestamp as naive UTC 'YYYY-MM-DDTHH:MM:SS', parsed by NumPy in bulk."""
+    if not value:
+        return ''
+    if isinstance(value, datetime):
+        return value.isoformat()[:19]
+    if value.endswith('Z') or len(value) == 19:
+        return value[:19]
+
+    value = string_to_datetime(value)
+    return value.isoformat()[:19] if isinstance(value, datetime) else ''
+
+
+class ResourceTable:
+    """This object represents resources as columns of NumPy arrays.
+
+    The table is built from raw API pages, resource objects are not created.
+    Columns are accessed by name, rows are selected with boolean masks,
+    index arrays and slices, each selection returns a new table:
+
+      table = compute.disk_table(folder_id)
+      big = table[(table['size'] > 100 * 2 ** 30) & (table['zone_id'] == 'ru-central1-a')]
+      big = table.filter(zone_id='ru-central1-a', status=('READY', 'CREATING'))
+
+    Aggregations are computed in bulk, grouped by columns or labels:
+
+      instances = InstanceTable.concat(compute.instance_table(folder_id) for folder_id in folder_ids)
+      instances.aggregate(by='zone_id')  # {'ru-central1-a': {'count': 10, 'cores': 20, 'vcpus': 4.0, ...}, ...}
+      instances.sum('memory', by=('platform_id', 'labels__env'))
+
+    Strings are kept in object arrays (the API strings are shared, not copied),
+    repeated values (zones, statuses, etc.) are stored as one object per table.
+    Missing values are '' for str, 0 (or the column default) for int and NaT for datetime.
+
+    Requires NumPy, install it with:
+    pip install yandex-cloud-client[numpy]
+
+    """
+
+    # name: (path in the raw dict, kind: str, category, int, bool, datetime or object, default)
+    COLUMNS = {}
+    # columns computed from other columns, returned by the properties of the same name
+    COMPUTED = ()
+    # columns summed by aggregate()
+    AGGREGATES = ()
+
+    def __init__(self, columns: dict):
+        if np is None:
+            raise ImportError('numpy is required for the resource tables. '
+                              'Install it with: pip install yandex-cloud-client[numpy]')
+
+        self._columns = columns
+        self._group_cache = {}
+
+    @staticmethod
+    def _values(rows: list, path: tuple) -> list:
+        if len(path) == 1:
+            key, = path
+            return [row.get(key) for row in rows]
+
+        values = rows
+        for key in path:
+            values = [value.get(key) if value is not None else None for value in values]
+        return values
+
+    @staticmethod
+    def _objects(values: list):
+        column = np.empty(len(values), dtype=object)
+        column[:] = values
+        return column
+
+    @classmethod
+    def _column(cls, values: list, kind: str, default):
+        if kind == 'str':
+            return cls._objects([value if value is not None else '' for value in values])
+        if kind == 'category':
+            unique = {'': ''}
+            return cls._objects([unique.setdefault(value, value) if value is not None else '' for value in values])
+        if kind == 'int':
+            return np.array([int(value) if value is not None else default for value in values], dtype='int64')
+        if kind == 'bool':
+            return np.array([bool(value) for value in values], dtype=bool)
+        if kind == 'datetime':
+            return np.array([_utc_seconds(value) for value in values], dtype='datetime64[s]')
+
+        return cls._objects([value if value is not None else default() for value in values])
+
+    @classmethod
+    def from_pages(cls, pages) -> 'ResourceTable':
+        """Builds the table from raw API pages (lists of resource dicts).
+        Pages are read one by one, each page can be freed after it is read.
+        """
+        values = {name: [] for name in cls.COLUMNS}
+        for page in pages:
+            for name, (path, _, _) in cls.COLUMNS.items():
+                values[name].extend(cls._values(page or (), path))
+
+        return cls({name: cls._column(values[name], kind, default)
+                    for name, (_, kind, default) in cls.COLUMNS.items()})
+
+    @classmethod
+    def from_raw(cls, resources: list) -> 'ResourceTable':
+        """Builds the table from raw resource dicts."""
+        return cls.from_pages([resources])
+
+    @classmethod
+    def from_objects(cls, resources) -> 'ResourceTable':
+        """Builds the table from listing results: LazyList (its raw dicts are used) or list of objects."""
+        if isinstance(resources, LazyList):
+            return cls.from_raw(resources.raw)
+
+        resources = list(resources)
+        columns = {}
+        for name, (path, kind, default) in cls.COLUMNS.items():
+            values = resources
+            for attr in path:
+                values = [getattr(value, attr, None) for value in values]
+            columns[name] = cls._column(values, kind, default)
+        return cls(columns)
+
+    @classmethod
+    def concat(cls, tables) -> 'ResourceTable':
+        """Joins tables (e.g. of different folders) into one."""
+        tables = list(tables)
+        if not tables:
+            return cls.from_pages([])
+        return cls({name: np.concatenate([table._columns[name] for table in tables]) for name in cls.COLUMNS})
+
+    @property
+    def columns(self) -> tuple:
+        return tuple(self._columns)
+
+    def __len__(self):
+        return len(self._columns['id'])
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return self.column(key)
+        if isinstance(key, (int, np.integer)):
+            return self.row(key)
+        return self.__class__({name: column[key] for name, column in self._columns.items()})
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self.row(index)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({len(self)} rows, columns: {", ".join(self.columns)})'
+
+    def row(self, index: int) -> dict:
+        """Returns the row as dict of Python values."""
+        row = {name: column[index] for name, column in self._columns.items()}
+        return {name: value.item() if isinstance(value, np.generic) else value for name, value in row.items()}
+
+    def column(self, name: str):
+        """Returns the column by name, label values for labels__key or a computed column."""
+        if name in self._columns:
+            return self._columns[name]
+        if name.startswith('labels__'):
+            return self.label(name[len('labels__'):])
+        if name in self.COMPUTED:
+            return getattr(self, name)
+        raise KeyError(name)
+
+    def label(self, key: str):
+        """Returns array of the label values ('' if the resource has no such label)."""
+        return self._objects([labels.get(key, '') for labels in self._columns['labels']])
+
+    def mask(self, **conditions):
+        """Returns boolean mask of the rows matching all conditions.
+        Value may be a list, tuple or set of allowed values, labels are matched with labels__key=value.
+        """
+        result = np.ones(len(self), dtype=bool)
+        for field, expected in conditions.items():
+            column = self.column(field)
+            if isinstance(expected, (list, tuple, set, frozenset)):
+                result &= np.isin(column, list(expected))
+            else:
+                result &= column == expected
+        return result
+
+    def filter(self, mask=None, **conditions) -> 'ResourceTable':
+        """Returns table of the rows matching the conditions (and mask, if passed)."""
+        result = self.mask(**conditions)
+        if mask is not None:
+            result &= mask
+        return self[result]
+
+    def _groups(self, by) -> tuple:
+        """Returns keys of the groups (in order of appearance), number of rows in each group
+        and the row order sorted by group with the group start positions, for _group_sums().
+        """
+        by = by if isinstance(by, str) else tuple(by)
+        if by not in self._group_cache:
+            self._group_cache[by] = self._factorize(by)
+        return self._group_cache[by]
+
+    def _factorize(self, by) -> tuple:
+        if isinstance(by, str):
+            keys = self.column(by).tolist()
+        else:
+            keys = list(zip(*(self.column(name).tolist() for name in by)))
+
+        index = {}
+        codes = np.fromiter((index.setdefault(key, len(index)) for key in keys), dtype=np.intp, count=len(keys))
+        counts = np.bincount(codes, minlength=len(index))
+        starts = np.cumsum(counts) - counts
+        return list(index), counts, np.argsort(codes, kind='stable'), starts
+
+    def _numeric(self, name: str):
+        column = self.column(name)
+        return column.astype('int64') if column.dtype == bool else column
+
+    @staticmethod
+    def _group_sums(values, order, starts):
+        """Sums values by groups, exact for int64 (rows are sorted by group and reduced in one pass)."""
+        if not len(starts):
+            return values[:0]
+        return np.add.reduceat(values[order], starts)
+
+    def count(self, by=None):
+        """Returns number of rows, or {group: number} if by (column name or tuple of names) passed."""
+        if by is None:
+            return len(self)
+        keys, counts, _, _ = self._groups(by)
+        return dict(zip(keys, counts.tolist()))
+
+    def sum(self, column: str, by=None):
+        """Returns sum of the column, or {group: sum} if by (column name or tuple of names) passed."""
+        values = self._numeric(column)
+        if by is None:
+            return values.sum().item()
+        keys, _, order, starts = self._groups(by)
+        return dict(zip(keys, self._group_sums(values, order, starts).tolist()))
+
+    def aggregate(self, by=None, columns=None) -> dict:
+        """Returns count and sums of the columns (AGGREGATES by default) as {name: value},
+        or {group: {name: value}} if by (column name or tuple of names) passed.
+        """
+        columns = columns or self.AGGREGATES
+        if by is None:
+            return {'count': len(self), **{name: self.sum(name) for name in columns}}
+
+        keys, counts, order, starts = self._groups(by)
+        totals = {'count': counts.tolist()}
+        for name in columns:
+            totals[name] = self._group_sums(self._numeric(name), order, starts).tolist()
+
+        return {key: {name: values[index] for name, values in totals.items()} for index, key in enumerate(keys)}
+
+
+class InstanceTable(ResourceTable):
+    """This object represents instances as columns.
+
+    Columns:
+      :id: str
+      :folder_id: str
+      :name: str
+      :zone_id: str
+      :platform_id: str
+      :status: str
+      :created_at: datetime64
+      :cores: int
+      :memory: int, bytes
+      :core_fraction: int, percents (100 if not set)
+      :gpus: int
+      :preemptible: bool
+      :labels: dict
+      :vcpus: float, computed - cores weighted by core_fraction
+
+    """
+
+    COLUMNS = {
+        'id': (('id',), 'str', None),
+        'folder_id': (('folder_id',), 'category', None),
+        'name': (('name',), 'str', None),
+        'zone_id': (('zone_id',), 'category', None),
+        'platform_id': (('platform_id',), 'category', None),
+        'status': (('status',), 'category', None),
+        'created_at': (('created_at',), 'datetime', None),
+        'cores': (('resources', 'cores'), 'int', 0),
+        'memory': (('resources', 'memory'), 'int', 0),
+        'core_fraction': (('resources', 'core_fraction'), 'int', 100),
+        'gpus': (('resources', 'gpus'), 'int', 0),
+        'preemptible': (('scheduling_policy', 'preemptible'), 'bool', False),
+        'labels': (('labels',), 'object', dict),
+    }
+    COMPUTED = ('vcpus',)
+    AGGREGATES = ('cores', 'vcpus', 'memory', 'gpus')
+
+    @property
+    def vcpus(self):
+        """Cores weighted by core fraction, e.g. 2 cores with 20% are 0.4 vCPU."""
+        return self._columns['cores'] * self._columns['core_fraction'] / 100
+
+
+class DiskTable(ResourceTable):
+    """This object represents disks as columns.
+
+    Columns:
+      :id: str
+      :folder_id: str
+      :name: str
+      :type_id: str
+      :zone_id: str
+      :status: str
+      :created_at: datetime64
+      :size: int, bytes
+      :attached: bool
+      :labels: dict
+
+    """
+
+    COLUMNS = {
+        'id': (('id',), 'str', None),
+        'folder_id': (('folder_id',), 'category', None),
+        'name': (('name',), 'str', None),
+        'type_id': (('type_id',), 'category', None),
+        'zone_id': (('zone_id',), 'category', None),
+        'status': (('status',), 'category', None),
+        'created_at': (('created_at',), 'datetime', None),
+        'size': (('size',), 'int', 0),
+        'attached': (('instance_ids',), 'bool', False),
+        'labels': (('labels',), 'object', dict),
+    }
+    AGGREGATES = ('size',)
+
+
+class SnapshotTable(ResourceTable):
+    """This object represents snapshots as columns.
+
+    Columns:
+      :id: str
+      :folder_id: str
+      :name: str
+      :status: str
+      :created_at: datetime64
+      :storage_size: int, bytes
+      :disk_size: int, bytes
+      :source_disk_id: str
+      :labels: dict
+
+    """
+
+    COLUMNS = {
+        'id': (('id',), 'str', None),
+        'folder_id': (('folder_id',), 'category', None),
+        'name': (('name',), 'str', None),
+        'status': (('status',), 'category', None),
+        'created_at': (('created_at',), 'datetime', None),
+        'storage_size': (('storage_size',), 'int', 0),
+        'disk_size': (('disk_size',), 'int', 0),
+        'source_disk_id': (('source_disk_id',), 'str', None),
+        'labels': (('labels',), 'object', dict),
+    }
+    AGGREGATES = ('storage_size', 'disk_size')
@@ -15,5 +15,16 @@ IP_VERSIONS = ('IPV4', 'IPV6')
 BASE_HEADERS = {'content-type': 'application/json'}
 DEFAULT_TIMEOUT = 10
 DEFAULT_OP_TIMEOUT = 600
+DEFAULT_POOL_SIZE = 10
+DEFAULT_ASYNC_POOL_SIZE = 100
+DEFAULT_BLOCKING_WORKERS = 32
+DEFAULT_CRAWLER_WORKERS = 8
+CRAWLER_QUEUE_PER_WORKER = 100
+KEY_CACHE_SIZE = 4096
+DATETIME_CACHE_SIZE = 4096
+DISABLE_LOG_ENV = 'YANDEX_CLOUD_CLIENT_DISABLE_LOG'
+DEFAULT_CACHE_TTL = 60
+DEFAULT_CACHE_SIZE = 1024
+DEFAULT_NEGATIVE_CACHE_TTL = 10
 SECONDS_IN_DAY = 86400
 AZ = ('ru-central1-a', 'ru-central1-b', 'ru-central1-c')
@@ -54,6 +54,13 @@ class OperationDeadlineExceeded(YandexCloudError):
     pass
 
 
+class OperationsFailed(YandexCloudError):
+    def __init__(self, failures: dict, completed: list = None):
+        self.failures = failures
+        self.completed = completed or []
+        super().__init__(f'{len(failures)} operation(s) failed: {", ".join(failures)}')
+
+
 class HTTPError(YandexCloudError):
     pass
 
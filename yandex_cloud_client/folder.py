@@ -3,12 +3,25 @@
 """This module contains Folder class."""
 
 from yandex_cloud_client.base import YandexCloudObject
+from yandex_cloud_client.utils.fields import Field
 from yandex_cloud_client.utils.helpers import string_to_datetime
 
 
 class Folder(YandexCloudObject):
     """This object represents a Folder."""
 
+    __slots__ = ('id', 'cloud_id', 'created_at', 'name', 'description', 'labels', 'status', 'client')
+    _id_fields = ('id', 'cloud_id')
+    _field_table = (
+        Field('id'),
+        Field('cloud_id'),
+        Field('created_at', string_to_datetime),
+        Field('name'),
+        Field('description'),
+        Field('labels'),
+        Field('status'),
+    )
+
     def __init__(self,
                  id=None,
                  cloud_id=None,
@@ -31,7 +44,6 @@ class Folder(YandexCloudObject):
         self.status = status
 
         self.client = client
-        self._id_attrs = (self.id, self.cloud_id)
 
     def update(self):
         pass
@@ -52,25 +64,6 @@ class Folder(YandexCloudObject):
     def update_access_bindings(self):
         pass
 
-    @classmethod
-    def de_json(cls, data: dict, client):
-        if not data:
-            return None
-
-        data = super(Folder, cls).de_json(data, client)
-        return cls(client=client, **data)
-
-    @classmethod
-    def de_list(cls, data: list, client):
-        if not data:
-            return []
-
-        folders = list()
-        for folder in data:
-            folders.append(cls.de_json(folder, client))
-
-        return folders
-
 
 class FolderSpec(YandexCloudObject):
     """This object represents a specification for new folder."""
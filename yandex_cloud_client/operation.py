@@ -3,12 +3,17 @@
 """This module contains Operation and OperationWait classes."""
 
 import time
+import random
 import asyncio
 import logging
+import threading
+
+from concurrent.futures import Future, InvalidStateError
 
 from yandex_cloud_client.base import YandexCloudObject
-from yandex_cloud_client.error import OperationDeadlineExceeded
-from yandex_cloud_client.utils.helpers import string_to_datetime, universal_obj_hook
+from yandex_cloud_client.utils.fields import Field
+from yandex_cloud_client.error import OperationDeadlineExceeded, OperationsFailed
+from yandex_cloud_client.utils.helpers import string_to_datetime, run_blocking, blocking_executor
 from yandex_cloud_client.utils.request import RpcError
 
 logger = logging.getLogger(__name__)
@@ -17,6 +22,23 @@ logger = logging.getLogger(__name__)
 class Operation(YandexCloudObject):
     """This object represents an operation."""
 
+    __slots__ = (
+        'id', 'created_at', 'created_by', 'modified_at', 'done', 'response', 'error', 'metadata',
+        'description', 'client'
+    )
+    _id_fields = ('id',)
+    _field_table = (
+        Field('id'),
+        Field('created_at', string_to_datetime),
+        Field('created_by'),
+        Field('modified_at', string_to_datetime),
+        Field('done', bool, always=True),
+        Field('response'),
+        Field('error', nested='OperationError'),
+        Field('metadata', nested='OperationMetadata'),
+        Field('description'),
+    )
+
     def __init__(self,
                  id=None,
                  created_at=None,
@@ -46,7 +68,6 @@ class Operation(YandexCloudObject):
         self.description = description
 
         self.client = client
-        self._id_attrs = (self.id,)
 
     @property
     def failed(self):
@@ -68,31 +89,29 @@ class Operation(YandexCloudObject):
         """Shortcut for client.operation()."""
         return self.client.operation(self.id, *args, **kwargs)
 
-    @classmethod
-    def de_json(cls, data, client):
-        if not data:
-            return None
-
-        data = super(Operation, cls).de_json(data, client)
-        data['metadata'] = OperationMetadata.de_json(universal_obj_hook(data.get('metadata')), client)
-        data['error'] = OperationError.de_json(universal_obj_hook(data.get('error')), client)
-        return cls(client=client, **data)
-
-    @classmethod
-    def de_list(cls, data, client):
-        if not data:
-            return []
-
-        operations = list()
-        for operation in data:
-            operations.append(cls.de_json(operation, client))
-
-        return operations
+    def watch(self, *args, **kwargs):
+        """Shortcut for client.watch_operation()."""
+        return self.client.watch_operation(self, *args, **kwargs)
 
 
 class OperationMetadata(YandexCloudObject):
     """This object represents an operation metadata."""
 
+    __slots__ = (
+        'instance_id', 'disk_id', 'snapshot_id', 'image_id', 'subnet_id', 'network_id', 'certificate_id',
+        'client'
+    )
+    _resource_types = ('snapshot', 'image', 'certificate', 'disk', 'instance', 'subnet', 'network')
+    _field_table = (
+        Field('instance_id'),
+        Field('disk_id'),
+        Field('snapshot_id'),
+        Field('image_id'),
+        Field('subnet_id'),
+        Field('network_id'),
+        Field('certificate_id'),
+    )
+
     def __init__(self,
                  instance_id=None,
                  disk_id=None,
@@ -116,18 +135,31 @@ class OperationMetadata(YandexCloudObject):
 
         self.client = client
 
-    @classmethod
-    def de_json(cls, data, client):
-        if not data:
-            return None
+    @property
+    def resource_type(self):
+        """Type of the resource the operation is performed on."""
+        for resource_type in self._resource_types:
+            if getattr(self, f'{resource_type}_id') is not None:
+                return resource_type
+        return None
 
-        data = super(OperationMetadata, cls).de_json(data, client)
-        return cls(client=client, **data)
+    @property
+    def resource_ids(self) -> dict:
+        """Ids of the resources the operation is performed on, as {resource type: id}."""
+        return {resource_type: getattr(self, f'{resource_type}_id') for resource_type in self._resource_types
+                if getattr(self, f'{resource_type}_id') is not None}
 
 
 class OperationError(YandexCloudObject):
     """This object represents an operation metadata."""
 
+    __slots__ = ('code', 'message', 'details', 'client')
+    _field_table = (
+        Field('code', lambda value: RpcError(int(value))),
+        Field('message'),
+        Field('details'),
+    )
+
     def __init__(self,
                  code=None,
                  message=None,
@@ -143,25 +175,88 @@ class OperationError(YandexCloudObject):
 
         self.client = client
 
+
+class PollingStrategy:
+    """This class represents an operation polling strategy.
+
+    The first poll is made after `initial` seconds, then the delay grows
+    exponentially by `factor` up to `maximum` seconds.
+    Each delay is randomized by +-`jitter` (fraction of the delay),
+    so many waiters don't poll the API at the same moment.
+
+    Use PollingStrategy.for_operation() to get the strategy
+    with hints for the operation resource type.
+
+    """
+
+    # resource type: (initial, maximum) delays in seconds
+    HINTS = {
+        'instance': (0.5, 5),
+        'disk': (1, 10),
+        'subnet': (1, 10),
+        'network': (1, 10),
+        'snapshot': (3, 30),
+        'image': (5, 60),
+        'certificate': (5, 60),
+    }
+
+    def __init__(self, initial=1, factor=1.5, maximum=20, jitter=0.1):
+        self.initial = float(initial)
+        self.factor = float(factor)
+        self.maximum = float(maximum)
+        self.jitter = float(jitter)
+
+    def delay(self, attempt: int) -> float:
+        """Returns delay in seconds before the poll number `attempt` (from zero)."""
+        delay = min(self.maximum, self.initial * self.factor ** attempt)
+        if self.jitter:
+            delay *= 1 + random.uniform(-self.jitter, self.jitter)
+        return max(delay, 0)
+
     @classmethod
-    def de_json(cls, data, client):
-        if not data:
-            return None
+    def fixed(cls, delay):
+        """Returns strategy with constant delay between polls."""
+        return cls(initial=delay, factor=1, maximum=delay, jitter=0)
 
-        data = super(OperationError, cls).de_json(data, client)
-        return cls(client=client, **data)
+    @classmethod
+    def for_operation(cls, operation: Operation, **kwargs):
+        """Returns strategy with delays hinted by the operation resource type."""
+        metadata = operation.metadata if operation is not None else None
+        hint = cls.HINTS.get(metadata.resource_type) if metadata is not None else None
 
+        if hint is not None:
+            kwargs.setdefault('initial', hint[0])
+            kwargs.setdefault('maximum', hint[1])
+        return cls(**kwargs)
 
 
 class OperationWait:
-    """This class represents an operation waiter."""
+    """This class represents an operation waiter.
+
+    The async waiter never blocks the event loop: with the async client
+    the status is awaited on the async transport, with the sync client
+    each status request runs in a bounded executor (shared by default).
+
+    Delays between polls are taken from the polling strategy,
+    by default PollingStrategy.for_operation() is used.
+    If `delay` is specified, the status is polled with constant delay.
+
+    """
 
-    def __init__(self, operation: Operation, delay=2, timeout=600,
-                 client=None, **kwargs):
+    def __init__(self, operation: Operation, delay=None, timeout=600,
+                 client=None, executor=None, polling=None, **kwargs):
 
         self._operation = operation
-        self._delay = int(delay)
         self._deadline = time.time() + int(timeout) if timeout is not None else None
+        self._executor = executor
+        self._attempt = 0
+
+        if polling is not None:
+            self._polling = polling
+        elif delay is not None:
+            self._polling = PollingStrategy.fixed(delay)
+        else:
+            self._polling = PollingStrategy.for_operation(operation)
 
         self.client = client
 
@@ -172,21 +267,45 @@ class OperationWait:
     @property
     def completed(self):
         """Sync operation waiter."""
-        while not self._wait_operation():
+        while not self._check_operation():
             logger.debug('Sleeping.. sync awaiting operation status..')
-            time.sleep(self._delay)
-        return self._wait_operation()
+            time.sleep(self._next_delay())
+            self._wait_operation()
+        return self._operation
 
-    async def await_complete_async(self):
-        """Async operation waiter."""
-        while not self._wait_operation():
+    async def await_complete_async(self, limiter: asyncio.Semaphore = None):
+        """Async operation waiter.
+        If limiter is specified, it's acquired for each status request.
+        """
+        while not self._check_operation():
             logger.debug('Async awaiting operation status..')
-            await asyncio.sleep(self._delay)
-        return self._wait_operation()
+            await asyncio.sleep(self._next_delay())
+
+            if limiter is None:
+                await self._await_operation()
+            else:
+                async with limiter:
+                    await self._await_operation()
+        return self._operation
+
+    def _next_delay(self) -> float:
+        delay = self._polling.delay(self._attempt)
+        self._attempt += 1
+
+        if self._deadline is not None:
+            delay = min(delay, max(self._deadline - time.time(), 0))
+        return delay
 
     def _wait_operation(self):
         self._operation = self._operation.update_status()
 
+    async def _await_operation(self):
+        if asyncio.iscoroutinefunction(self._operation.client.operation):
+            self._operation = await self._operation.update_status()
+        else:
+            self._operation = await run_blocking(self._operation.update_status, executor=self._executor)
+
+    def _check_operation(self):
         if self._operation.failed:
             logger.debug('Operation failed!')
             raise RuntimeError(self._operation.error)
@@ -195,7 +314,284 @@ class OperationWait:
             logger.debug('Operation done!')
             return self._operation
 
-        elif time.time() >= self._deadline:
+        elif self._deadline is not None and time.time() >= self._deadline:
             logger.debug('Deadline exceeded!')
             raise OperationDeadlineExceeded(self._operation.id,
                 self._operation.description)
+
+
+class OperationGroup:
+    """This class represents an async waiter for many operations.
+
+    Status requests of all operations are limited by `concurrency`
+    and all operations share one deadline (`timeout` seconds from creation).
+    A failed or expired operation doesn't abort the others,
+    its error is collected in `failures` by operation id.
+
+    Example:
+      group = OperationGroup([disk.create_snapshot(await_complete=False) for disk in disks])
+      async for operation in group.as_completed():
+          print(f'{operation.id} done')
+
+    """
+
+    def __init__(self, operations: list, concurrency=10, timeout=600,
+                 polling=None, executor=None, **kwargs):
+
+        self._operations = list(operations)
+        self._concurrency = int(concurrency)
+        self._deadline = time.time() + int(timeout) if timeout is not None else None
+        self._polling = polling
+        self._executor = executor
+
+        self._limiter = None
+        self._tasks = None
+        self._returned = set()
+
+        self.failures = {}
+
+    @property
+    def operations(self):
+        return self._operations
+
+    def __len__(self):
+        return len(self._operations)
+
+    def _start(self):
+        if self._tasks is not None:
+            return self._tasks
+
+        self._limiter = asyncio.Semaphore(self._concurrency)
+        self._tasks = [asyncio.ensure_future(self._wait(operation)) for operation in self._operations]
+        return self._tasks
+
+    async def _wait(self, operation):
+        timeout = max(self._deadline - time.time(), 0) if self._deadline is not None else None
+        waiter = OperationWait(operation, timeout=timeout, polling=self._polling, executor=self._executor)
+        try:
+            return await waiter.await_complete_async(limiter=self._limiter)
+        except Exception as err:
+            logger.debug(f'Operation {operation.id} failed: {err}')
+            self.failures[operation.id] = err
+            raise
+
+    @staticmethod
+    def _result(task, return_exceptions):
+        if task.exception() is None:
+            return task.result()
+        if return_exceptions:
+            return task.exception()
+        raise task.exception()
+
+    async def wait_all(self, return_exceptions=False) -> list:
+        """Wait for all operations.
+        Returns completed operations in the same order as received.
+        If some operations fail, raises OperationsFailed after all operations finished,
+        or returns errors in place of operations with return_exceptions=True.
+        """
+        tasks = self._start()
+        await asyncio.wait(tasks)
+
+        results = [self._result(task, return_exceptions=True) for task in tasks]
+        if self.failures and not return_exceptions:
+            completed = [result for result in results if isinstance(result, Operation)]
+            raise OperationsFailed(self.failures, completed)
+        return results
+
+    async def wait_any(self, return_exceptions=False) -> Operation:
+        """Wait for the first finished operation, the others keep running.
+        Every call returns the next operation not returned yet, so N calls return each of N operations once.
+        Raises the operation error if it failed, or returns it with return_exceptions=True.
+        Raises RuntimeError if all operations are already returned.
+        """
+        tasks = [task for task in self._start() if task not in self._returned]
+        if not tasks:
+            raise RuntimeError('All operations of the group are already returned')
+
+        finished = next((task for task in tasks if task.done()), None)
+        if finished is None:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            finished = next(task for task in tasks if task in done)
+
+        self._returned.add(finished)
+        return self._result(finished, return_exceptions)
+
+    async def as_completed(self, return_exceptions=False):
+        """Async iterator over operations in order of completion.
+        Failed operations are skipped and raised as OperationsFailed at the end of iteration,
+        or yielded as errors with return_exceptions=True.
+        """
+        pending = set(self._start())
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    yield task.result()
+                elif return_exceptions:
+                    yield task.exception()
+
+        if self.failures and not return_exceptions:
+            raise OperationsFailed(self.failures)
+
+
+class _Watch:
+    """This class represents a watched operation of the OperationPoller."""
+
+    def __init__(self, operation: Operation, polling: PollingStrategy, deadline=None):
+        self.operation = operation
+        self.polling = polling
+        self.deadline = deadline
+        self.future = Future()
+        self.attempt = 0
+        self.next_poll = time.time()
+        self.schedule()
+
+    def schedule(self):
+        delay = self.polling.delay(self.attempt)
+        self.attempt += 1
+        self.next_poll = time.time() + delay
+        if self.deadline is not None:
+            self.next_poll = min(self.next_poll, self.deadline)
+
+
+class OperationPoller:
+    """This class represents a shared background poller of operations.
+
+    One background thread polls all watched operations.
+    All waiters of the same operation id share a single future,
+    so the number of status requests depends on the number of
+    distinct operations, not on the number of waiters.
+
+    Usually, you don't need to create it, use client.poller or client.watch_operation().
+
+    Example:
+      future = client.watch_operation(operation, callback=lambda f: print(f.result().id))
+      operation = future.result()
+
+    """
+
+    def __init__(self, client, polling=None, timeout=600, executor=None, **kwargs):
+        self._client = client
+        self._polling = polling
+        self._timeout = int(timeout) if timeout is not None else None
+        self._executor = executor
+
+        self._watches = {}
+        self._condition = threading.Condition()
+        self._thread = None
+        self._stopped = False
+
+    def __len__(self):
+        return len(self._watches)
+
+    def watch(self, operation: Operation, callback=None) -> Future:
+        """Returns future of the completed operation.
+        Callback is called with the future when the operation is done or failed.
+        """
+        with self._condition:
+            if self._stopped:
+                raise RuntimeError('Operation poller is stopped')
+
+            watch = self._watches.get(operation.id)
+            if watch is None:
+                polling = self._polling or PollingStrategy.for_operation(operation)
+                deadline = time.time() + self._timeout if self._timeout is not None else None
+                watch = _Watch(operation, polling, deadline=deadline)
+
+                if not self._resolve(watch):
+                    self._watches[operation.id] = watch
+                    self._start()
+                    self._condition.notify()
+
+        if callback is not None:
+            watch.future.add_done_callback(callback)
+        return watch.future
+
+    def stop(self):
+        """Stop the background thread, then pending futures are cancelled."""
+        with self._condition:
+            self._stopped = True
+            watches, self._watches = self._watches, {}
+            self._condition.notify()
+
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+        for watch in watches.values():
+            watch.future.cancel()
+
+    def _start(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name='yc-operation-poller', daemon=True)
+            self._thread.start()
+
+    @staticmethod
+    def _set_future(future: Future, result=None, error=None):
+        """Set result or error of the future, unless it is already done (e.g. cancelled by stop)."""
+        if future.done():
+            return
+
+        try:
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+        except InvalidStateError:
+            pass
+
+    def _resolve(self, watch: _Watch) -> bool:
+        """Set result or error of the future, if the operation is finished."""
+        if watch.future.done():
+            return True
+
+        operation = watch.operation
+        try:
+            if operation.failed:
+                raise RuntimeError(operation.error)
+            elif operation.completed:
+                self._set_future(watch.future, result=operation)
+                return True
+            elif watch.deadline is not None and time.time() >= watch.deadline:
+                raise OperationDeadlineExceeded(operation.id, operation.description)
+        except Exception as err:
+            self._set_future(watch.future, error=err)
+            return True
+        return False
+
+    def _poll(self, watch: _Watch):
+        try:
+            watch.operation = self._client.operation(watch.operation.id)
+        except Exception as err:
+            logger.debug(f'Operation {watch.operation.id} status request failed: {err}')
+            self._set_future(watch.future, error=err)
+            return
+
+        if not self._resolve(watch):
+            watch.schedule()
+
+    def _run(self):
+        executor = self._executor or blocking_executor()
+
+        while True:
+            with self._condition:
+                while not self._stopped:
+                    now = time.time()
+                    due = [watch for watch in self._watches.values() if watch.next_poll <= now]
+                    if due:
+                        break
+
+                    timeout = min((watch.next_poll for watch in self._watches.values()), default=None)
+                    self._condition.wait(timeout - now if timeout is not None else None)
+
+                if self._stopped:
+                    return
+
+            logger.debug(f'Polling {len(due)} operation(s)..')
+            for _ in executor.map(self._poll, due):
+                pass
+
+            with self._condition:
+                for watch in due:
+                    if watch.future.done():
+                        self._watches.pop(watch.operation.id, None)
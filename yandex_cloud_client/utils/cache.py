@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""This module contains ResourceCache class."""
+
+import copy
+import time
+import threading
+
+from collections import OrderedDict, namedtuple
+
+from yandex_cloud_client.constants import DEFAULT_CACHE_TTL, DEFAULT_CACHE_SIZE, DEFAULT_NEGATIVE_CACHE_TTL
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+class ResourceCache:
+    """This object represents a cache of the resources received by id (instance, disk, folder, etc.).
+
+    Raw API dicts are kept by resource type and id, every type has its own
+    LRU with at most `maxsize` entries, entries expire after `ttl` seconds.
+    ttl and maxsize may be numbers or dicts by resource type ('instance', 'disk', ...):
+
+      cache = ResourceCache(ttl={'instance': 10, 'folder': 3600}, maxsize=1000)
+      compute = ComputeClient(oauth_token='...', cache=cache)
+
+      compute.instance(instance_id)                   # from the API
+      compute.instance(instance_id)                   # from the cache
+      compute.instance(instance_id, use_cache=False)  # from the API, the cache is refreshed
+      cache.invalidate('instance', instance_id)
+      cache.info('instance')                          # CacheInfo(hits=1, misses=1, maxsize=1000, currsize=0)
+
+    Not found (404) ids are remembered for `negative_ttl` seconds (0 disables it),
+    the next get of such id raises ResourceNotFound without a request.
+    Operations of the client evict their resources, so creates clear the negative entries too.
+
+    The cache is thread-safe and can be shared by several clients of the same account.
+
+    """
+
+    def __init__(self, ttl=DEFAULT_CACHE_TTL, maxsize=DEFAULT_CACHE_SIZE, negative_ttl=DEFAULT_NEGATIVE_CACHE_TTL):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.negative_ttl = negative_ttl
+
+        self._entries = {}
+        self._missing = {}
+        self._hits = {}
+        self._misses = {}
+        self._lock = threading.Lock()
+
+    def _ttl(self, resource_type: str):
+        return self.ttl.get(resource_type, DEFAULT_CACHE_TTL) if isinstance(self.ttl, dict) else self.ttl
+
+    def _maxsize(self, resource_type: str):
+        return self.maxsize.get(resource_type, DEFAULT_CACHE_SIZE) if isinstance(self.maxsize, dict) else self.maxsize
+
+    def _lookup(self, store: dict, resource_type: str, resource_id: str):
+        """Returns the value of the unexpired entry (counted as hit) or None, must be called with the lock."""
+        entries = store.get(resource_type)
+        entry = entries.get(resource_id) if entries else None
+
+        if entry is not None and entry[0] > time.monotonic():
+            entries.move_to_end(resource_id)
+            self._hits[resource_type] = self._hits.get(resource_type, 0) + 1
+            return entry[1]
+
+        if entry is not None:
+            del entries[resource_id]
+        return None
+
+    def _store(self, store: dict, resource_type: str, resource_id: str, value, ttl):
+        maxsize = self._maxsize(resource_type)
+        if not maxsize or not ttl:
+            return
+
+        with self._lock:
+            entries = store.setdefault(resource_type, OrderedDict())
+            entries[resource_id] = (time.monotonic() + ttl, value)
+            entries.move_to_end(resource_id)
+            while len(entries) > maxsize:
+                entries.popitem(last=False)
+
+    def get(self, resource_type: str, resource_id: str):
+        """Returns a copy of the cached resource or None."""
+        with self._lock:
+            resource = self._lookup(self._entries, resource_type, resource_id)
+            if resource is None:
+                self._misses[resource_type] = self._misses.get(resource_type, 0) + 1
+                return None
+        return copy.deepcopy(resource)
+
+    def set(self, resource_type: str, resource_id: str, resource):
+        """Puts a copy of the resource to the cache, the least recently used one of the type is evicted if it is full.
+        Callers and deserializers may change their dicts, the cached one is never shared with them.
+        """
+        if not resource_id or resource is None:
+            return
+
+        self._store(self._entries, resource_type, resource_id, copy.deepcopy(resource), self._ttl(resource_type))
+        with self._lock:
+            missing = self._missing.get(resource_type)
+            if missing:
+                missing.pop(resource_id, None)
+
+    def get_missing(self, resource_type: str, resource_id: str):
+        """Returns the error message if the resource was not found recently, otherwise None."""
+        with self._lock:
+            return self._lookup(self._missing, resource_type, resource_id)
+
+    def set_missing(self, resource_type: str, resource_id: str, message: str):
+        """Remembers that the resource is not found, for negative_ttl seconds."""
+        if not resource_id:
+            return
+
+        self._store(self._missing, resource_type, resource_id, message or 'Not found', self.negative_ttl)
+        with self._lock:
+            entries = self._entries.get(resource_type)
+            if entries:
+                entries.pop(resource_id, None)
+
+    def invalidate(self, resource_type: str = None, resource_id: str = None):
+        """Removes the resource, all resources of the type or everything (without arguments).
+        With resource_id only, the id is removed from all types.
+        Negative (not found) entries are removed as well.
+        """
+        with self._lock:
+            for store in (self._entries, self._missing):
+                if resource_type is None:
+                    types = list(store.values())
+                else:
+                    types = [store[resource_type]] if resource_type in store else []
+
+                for entries in types:
+                    if resource_id is None:
+                        entries.clear()
+                    else:
+                        entries.pop(resource_id, None)
+
+    def clear(self):
+        """Removes everything and resets the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._missing.clear()
+            self._hits.clear()
+            self._misses.clear()
+
+    def info(self, resource_type: str = None):
+        """Returns CacheInfo of the type, or {type: CacheInfo} for all types without arguments.
+        Hits include the not found ids raised from the cache, currsize counts found resources only.
+        """
+        if resource_type is None:
+            with self._lock:
+                types = set(self._entries) | set(self._hits) | set(self._misses)
+            return {name: self.info(name) for name in sorted(types)}
+
+        with self._lock:
+            return CacheInfo(self._hits.get(resource_type, 0), self._misses.get(resource_type, 0),
+                             self._maxsize(resource_type), len(self._entries.get(resource_type, ())))
+
+    def __len__(self):
+        with self._lock:
+            return sum(len(entries) for entries in self._entries.values())
+
+    def __repr__(self):
+        return (f'{self.__class__.__name__}(ttl={self.ttl}, maxsize={self.maxsize}, '
+                f'negative_ttl={self.negative_ttl}, size={len(self)})')
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""This module contains JSON codecs for Request."""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _translate_keys(obj, key_hook):
+    if type(obj) is dict:
+        return {key_hook(key): (_translate_keys(value, key_hook) if type(value) in (dict, list) else value)
+                for key, value in obj.items()}
+    return [_translate_keys(item, key_hook) if type(item) in (dict, list) else item for item in obj]
+
+
+class JsonCodec:
+    """Stdlib JSON codec, parses bytes without decoding them to str first.
+
+    loads() translates keys of all objects with key_hook (if passed),
+    stdlib does it while parsing, so each object is built only once.
+
+    """
+
+    name = 'json'
+
+    @staticmethod
+    def loads(data: bytes, key_hook=None):
+        if key_hook is None:
+            return json.loads(data)
+        return json.loads(data, object_hook=lambda obj: {key_hook(key): value for key, value in obj.items()})
+
+    @staticmethod
+    def dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+class OrjsonCodec(JsonCodec):
+    """orjson codec, install it with:
+    pip install yandex-cloud-client[orjson]
+
+    orjson has no object hook, keys are translated in one pass after parsing.
+
+    """
+
+    name = 'orjson'
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError('orjson is required for the orjson codec. '
+                              'Install it with: pip install yandex-cloud-client[orjson]')
+
+    @staticmethod
+    def loads(data: bytes, key_hook=None):
+        result = orjson.loads(data)
+        if key_hook is None or type(result) not in (dict, list):
+            return result
+        return _translate_keys(result, key_hook)
+
+    @staticmethod
+    def dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+
+
+CODECS = {
+    JsonCodec.name: JsonCodec,
+    OrjsonCodec.name: OrjsonCodec,
+}
+
+
+def get_codec(codec=None) -> JsonCodec:
+    """Returns codec by name ('json' or 'orjson'), stdlib codec is used by default.
+    Codec objects with loads() and dumps() are returned as is.
+    """
+    if codec is None:
+        return JsonCodec()
+
+    if isinstance(codec, str):
+        if codec not in CODECS:
+            raise ValueError(f'Unknown JSON codec: {codec}. Supported: {tuple(CODECS)}')
+        return CODECS[codec]()
+
+    return codec
@@ -2,10 +2,13 @@
 # -*- coding: utf-8 -*-
 """This module contains decorator functions."""
 
+import os
 import time
+import asyncio
 import logging
 from functools import wraps
-from decorator import decorate
+
+from yandex_cloud_client.constants import DISABLE_LOG_ENV
 
 logger = logging.getLogger(__name__)
 
@@ -33,15 +36,62 @@ def retry(exceptions, tries=4, delay=5, backoff=2, logs=True):
     return retry_decorator
 
 
+def retry_async(exceptions, tries=4, delay=5, backoff=2, logs=True):
+    """Network errors decorator for retry coroutines."""
+    def retry_decorator(func):
+        @wraps(func)
+        async def func_retry(*args, **kwargs):
+            mtries, mdelay = tries, delay
+            while mtries > 1:
+                try:
+                    return await func(*args, **kwargs)
+                except exceptions as e:
+                    msg = f'Retrying in {mdelay} seconds.. caused by NetworkError: {e}'
+                    if logs:
+                        logger.warning(msg)
+                    else:
+                        print(msg)
+                    await asyncio.sleep(mdelay)
+                    mtries -= 1
+                    mdelay *= backoff
+            return await func(*args, **kwargs)
+        return func_retry
+    return retry_decorator
+
+
 def log(func, *args, **kwargs):
-    """Add debug messages to logger."""
+    """Add debug messages to logger.
+    Messages are built only if DEBUG is enabled for the module logger,
+    with YANDEX_CLOUD_CLIENT_DISABLE_LOG=1 in the environment methods are not wrapped at all.
+    """
+    if os.environ.get(DISABLE_LOG_ENV, '').lower() in ('1', 'true', 'yes'):
+        return func
+
     logger = logging.getLogger(func.__module__)
 
-    def decorator(self, *args, **kwargs):
-        logger.debug(f'Entering {func.__name__}')
+    if asyncio.iscoroutinefunction(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            if not logger.isEnabledFor(logging.DEBUG):
+                return await func(*args, **kwargs)
+
+            logger.debug('Entering %s', func.__name__)
+            result = await func(*args, **kwargs)
+            logger.debug('%s', result)
+            logger.debug('Exiting %s', func.__name__)
+            return result
+
+        return wrapper
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        if not logger.isEnabledFor(logging.DEBUG):
+            return func(*args, **kwargs)
+
+        logger.debug('Entering %s', func.__name__)
         result = func(*args, **kwargs)
-        logger.debug(result)
-        logger.debug(f'Exiting {func.__name__}')
+        logger.debug('%s', result)
+        logger.debug('Exiting %s', func.__name__)
         return result
 
-    return decorate(func, decorator)
+    return wrapper
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""This module contains Field class and the deserializer generator."""
+
+import sys
+import inspect
+import threading
+
+_deserializers = {}
+_lock = threading.RLock()
+
+
+class Field:
+    """This object describes how a model attribute is read from the API dict.
+
+    Arguments:
+      :name: str - attribute name
+      :convert: callable - applied to the value if it is not None (to any value if always=True)
+      :key: str - key in the API dict, name by default
+      :default: callable - factory for the falsy value (labels or {})
+      :nested: class or class name in the model module - value is deserialized with its de_json()
+      :many: bool - nested value is a list, deserialized like de_list()
+      :parent: dict - {nested key: parent key}, values of the parent copied into the nested dicts
+
+    """
+
+    __slots__ = ('name', 'convert', 'key', 'default', 'always', 'nested', 'many', 'parent')
+
+    def __init__(self, name, convert=None, key=None, default=None, always=False,
+                 nested=None, many=False, parent=None):
+
+        self.name = name
+        self.convert = convert
+        self.key = key or name
+        self.default = default
+        self.always = always
+        self.nested = nested
+        self.many = many
+        self.parent = parent or {}
+
+
+def _known_keys(cls) -> frozenset:
+    """Keys accepted by the model constructor, other keys are logged as unparsed."""
+    parameters = inspect.signature(cls.__init__).parameters.values()
+    return frozenset(p.name for p in parameters
+                     if p.name not in ('self', 'client') and p.kind is not p.VAR_KEYWORD)
+
+
+def _resolve(cls, nested):
+    if isinstance(nested, str):
+        return getattr(sys.modules[cls.__module__], nested)
+    return nested
+
+
+def _nested_call(cls, nested, namespace: dict, index: int) -> str:
+    nested = _resolve(cls, nested)
+    namespace[f'_class_{index}'] = nested
+
+    if '_field_table' in nested.__dict__:
+        namespace[f'_nested_{index}'] = compile_deserializer(nested)
+        return f'_nested_{index}(_class_{index}, {{}}, client)'
+    return f'_class_{index}.de_json({{}}, client)'
+
+
+def compile_deserializer(cls):
+    """Generates de_json(cls, data, client) function from cls._field_table.
+
+    The function creates the object without __init__ and kwargs,
+    result is the same as cls(client=client, **data) with nested objects deserialized.
+
+    """
+    with _lock:
+        if cls in _deserializers:
+            return _deserializers[cls]
+
+        table = cls._field_table
+        expected = {name for name in cls.__slots__ if name != 'client'}
+        if {field.name for field in table} != expected:
+            raise TypeError(f'Field table of {cls.__name__} does not match its __slots__')
+
+        namespace = {'_new': object.__new__, '_known': _known_keys(cls)}
+        lines = [
+            'def de_json(cls, data, client):',
+            '    if not data:',
+            '        return None',
+            '    get = data.get',
+            '    obj = _new(cls)',
+            '    if not _known.issuperset(data):',
+            '        cls.handle_unknown_kwargs(obj, **{key: value for key, value in data.items() '
+            'if key not in _known})',
+        ]
+
+        for index, field in enumerate(table):
+            attr, key = f'obj.{field.name}', repr(field.key)
+
+            if field.nested is not None:
+                call = _nested_call(cls, field.nested, namespace, index)
+                if not field.many and not field.parent:
+                    lines.append(f'    {attr} = {call.format(f"get({key})")}')
+                    continue
+
+                lines.append(f'    value = get({key})')
+                if field.parent:
+                    inject = [f'[{nested_key!r}] = get({parent_key!r})'
+                              for nested_key, parent_key in field.parent.items()]
+                    if field.many:
+                        lines.append('    for item in value or ():')
+                        lines.append('        if item is not None:')
+                        lines.extend(f'            item{x}' for x in inject)
+                    else:
+                        lines.append('    if value is not None:')
+                        lines.extend(f'        value{x}' for x in inject)
+
+                if field.many:
+                    lines.append(f'    {attr} = [{call.format("item")} for item in value] if value else []')
+                else:
+                    lines.append(f'    {attr} = {call.format("value")}')
+
+            elif field.convert is not None:
+                namespace[f'_convert_{index}'] = field.convert
+                if field.always:
+                    lines.append(f'    {attr} = _convert_{index}(get({key}))')
+                else:
+                    lines.append(f'    value = get({key})')
+                    lines.append(f'    {attr} = _convert_{index}(value) if value is not None else value')
+
+            elif field.default is not None:
+                namespace[f'_default_{index}'] = field.default
+                lines.append(f'    {attr} = get({key}) or _default_{index}()')
+
+            else:
+                lines.append(f'    {attr} = get({key})')
+
+        lines.append('    obj.client = client')
+        lines.append('    return obj')
+
+        source = '\n'.join(lines)
+        exec(compile(source, f'<{cls.__module__}.{cls.__name__}.de_json>', 'exec'), namespace)
+
+        deserializer = namespace['de_json']
+        deserializer.__source__ = source
+        _deserializers[cls] = deserializer
+        return deserializer
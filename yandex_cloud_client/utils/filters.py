@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""This module contains QueryFilter builder."""
+
+OPERATORS = ('=', '!=', 'IN', 'NOT IN')
+
+
+def _quote(value) -> str:
+    value = str(value).replace('\\', '\\\\').replace('"', '\\"')
+    return f'"{value}"'
+
+
+def _camel_case(field: str) -> str:
+    head, *tail = field.split('_')
+    return head + ''.join(word.capitalize() for word in tail)
+
+
+class QueryFilter:
+    """This class builds the filter expression for the list methods.
+
+    The filter is evaluated by API, so only matched resources are transferred.
+    Conditions are joined with AND:
+
+      QueryFilter(source_disk_id='fhm...').label('creator', 'snapshotter')
+      >>> sourceDiskId="fhm..." AND labels.creator="snapshotter"
+
+    Can be passed as query_filter to any list method of the client.
+
+    """
+
+    def __init__(self, query_filter=None, **fields):
+        self.conditions = list()
+
+        if query_filter:
+            self.conditions.extend(query_filter.conditions if isinstance(query_filter, QueryFilter)
+                                   else [str(query_filter)])
+
+        for field, value in fields.items():
+            self.where(_camel_case(field), value)
+
+    def __str__(self):
+        return ' AND '.join(self.conditions)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({str(self)!r})'
+
+    def __bool__(self):
+        return bool(self.conditions)
+
+    def __and__(self, other):
+        return QueryFilter(self).extend(other)
+
+    def extend(self, other):
+        """Add all conditions of other filter (or expression string)."""
+        self.conditions.extend(QueryFilter(other).conditions)
+        return self
+
+    def where(self, field: str, value, operator='='):
+        """Add `field <operator> value` condition, field is in API notation (camelCase)."""
+        operator = operator.upper()
+        if operator not in OPERATORS:
+            raise ValueError(f'Operator {operator} not supported. Supported: {OPERATORS}')
+
+        if operator in ('IN', 'NOT IN'):
+            values = ', '.join(_quote(x) for x in value)
+            self.conditions.append(f'{field} {operator} ({values})')
+        else:
+            self.conditions.append(f'{field}{operator}{_quote(value)}')
+        return self
+
+    def name(self, value, operator='='):
+        return self.where('name', value, operator)
+
+    def source_disk_id(self, value, operator='='):
+        return self.where('sourceDiskId', value, operator)
+
+    def label(self, key: str, value, operator='='):
+        return self.where(f'labels.{key}', value, operator)
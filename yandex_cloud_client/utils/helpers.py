@@ -5,11 +5,23 @@
 import re
 import yaml
 import json
+import asyncio
 import logging
+import threading
+import functools
 import datetime as dt
 
+from queue import Queue
+from concurrent.futures import ThreadPoolExecutor
+
+from yandex_cloud_client.constants import DEFAULT_BLOCKING_WORKERS, KEY_CACHE_SIZE, DATETIME_CACHE_SIZE
+
 logger = logging.getLogger(__name__)
 
+_executor = None
+_executor_lock = threading.Lock()
+_parse_datetime = None
+
 
 def disk_mode_converter(mode):
     modes = {
@@ -29,9 +41,31 @@ def convert_yaml_to_dict(data: yaml):
     return result
 
 
+_FIRST_CAP_RE = re.compile('(.)([A-Z][a-z]+)')
+_ALL_CAP_RE = re.compile('([a-z0-9])([A-Z])')
+
+
 def convert_camel_to_snake(text: str):
-    s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', text)
-    return re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
+    s1 = _FIRST_CAP_RE.sub(r'\1_\2', text)
+    return _ALL_CAP_RE.sub(r'\1_\2', s1).lower()
+
+
+@functools.lru_cache(maxsize=KEY_CACHE_SIZE)
+def translate_key(key: str) -> str:
+    """Converts API key to attribute name (camelCase and kebab-case to snake_case).
+    Results are cached, the set of API keys is small and repeats in every response.
+    """
+    key = convert_camel_to_snake(key.replace('-', '_'))
+
+    if len(key) and key[0].isdigit():
+        key = '_' + key
+
+    return key
+
+
+def key_cache_info():
+    """Returns hits, misses, maxsize and currsize of the key translation cache."""
+    return translate_key.cache_info()
 
 
 def universal_obj_hook(obj: [list, dict]):
@@ -48,15 +82,7 @@ def universal_obj_hook(obj: [list, dict]):
 
 
 def _object_hook(obj: dict):
-    cleaned_object = {}
-    for key, value in obj.items():
-        key = convert_camel_to_snake(key.replace('-', '_'))
-
-        if len(key) and key[0].isdigit():
-            key = '_' + key
-
-        cleaned_object.update({key: value})
-    return cleaned_object
+    return {translate_key(key): value for key, value in obj.items()}
 
 
 def human_readable_size(raw_bytes, granularity=2):
@@ -84,19 +110,156 @@ def from_timestamp(unixtime):
     return readable
 
 
+def parse_rfc3339(strtime: str) -> dt.datetime:
+    """Fast parser of RFC 3339 timestamps (2020-10-31T10:00:00.123Z, 2020-10-31T13:00:00+03:00).
+    Returns naive UTC datetime without fraction of seconds, raises ValueError for other formats.
+    """
+    if len(strtime) < 19 or strtime[10] not in 'Tt ':
+        raise ValueError(f'Invalid RFC 3339 timestamp: {strtime}')
+
+    result = dt.datetime.fromisoformat(strtime[:19])
+    tail = strtime[19:]
+    if tail[:1] == '.':
+        tail = tail[1:].lstrip('0123456789')
+
+    if tail in ('', 'Z', 'z'):
+        return result
+
+    if len(tail) == 6 and tail[0] in '+-' and tail[3] == ':':
+        offset = dt.timedelta(hours=int(tail[1:3]), minutes=int(tail[4:6]))
+        return result - offset if tail[0] == '+' else result + offset
+
+    raise ValueError(f'Invalid RFC 3339 timestamp: {strtime}')
+
+
+def set_datetime_cache_size(maxsize: int):
+    """Set size of the parsed timestamps cache, 0 disables the cache."""
+    global _parse_datetime
+    _parse_datetime = functools.lru_cache(maxsize=maxsize)(parse_rfc3339) if maxsize else parse_rfc3339
+
+
+def datetime_cache_info():
+    """Returns hits, misses, maxsize and currsize of the timestamps cache or None if disabled."""
+    cache_info = getattr(_parse_datetime, 'cache_info', None)
+    return cache_info() if cache_info is not None else None
+
+
+set_datetime_cache_size(DATETIME_CACHE_SIZE)
+
+
 def string_to_datetime(strtime):
+    if not isinstance(strtime, str):
+        return strtime
+
+    try:
+        return _parse_datetime(strtime)
+    except ValueError:
+        pass
+
     try:
         raw_time = strtime.split('.')[0]
         return dt.datetime.strptime(raw_time, '%Y-%m-%dT%H:%M:%S')
-    except IndexError:
-        return strtime
-    except ValueError:
-        return dt.datetime.strptime(strtime, '%Y-%m-%dT%H:%M:%Sz')
     except Exception as err:
         logger.debug(err)
         return strtime
 
 
+def blocking_executor() -> ThreadPoolExecutor:
+    """Returns shared bounded executor for blocking HTTP calls from coroutines."""
+    global _executor
+
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=DEFAULT_BLOCKING_WORKERS,
+                                               thread_name_prefix='yc-client')
+    return _executor
+
+
+async def run_blocking(func, *args, executor=None, **kwargs):
+    """Run blocking func in the executor without blocking the event loop."""
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(executor or blocking_executor(),
+                                      functools.partial(func, *args, **kwargs))
+
+
+def prefetch_iterator(iterator, depth=1):
+    """Yields items of the blocking iterator, which is consumed
+    by the background thread up to `depth` items ahead.
+    The next item is requested only when a slot is free, so at most
+    `depth` items are buffered besides the yielded one.
+    """
+    done = object()
+    items = Queue()
+    slots = threading.Semaphore(max(depth, 1))
+    stopped = threading.Event()
+
+    def acquire():
+        while not stopped.is_set():
+            if slots.acquire(timeout=0.1):
+                return True
+        return False
+
+    def produce():
+        if not acquire():
+            return
+        try:
+            for item in iterator:
+                items.put((item, None))
+                if not acquire():
+                    return
+            items.put((done, None))
+        except Exception as err:
+            items.put((done, err))
+
+    threading.Thread(target=produce, name='yc-prefetch', daemon=True).start()
+    try:
+        while True:
+            item, err = items.get()
+            if err is not None:
+                raise err
+            if item is done:
+                return
+            slots.release()
+            yield item
+    finally:
+        stopped.set()
+
+
+async def async_prefetch_iterator(iterator, depth=1):
+    """Yields items of the async iterator, which is consumed
+    by the background task up to `depth` items ahead.
+    The next item is requested only when a slot is free, so at most
+    `depth` items are buffered besides the yielded one.
+    """
+    done = object()
+    items = asyncio.Queue()
+    slots = asyncio.Semaphore(max(depth, 1))
+
+    async def produce():
+        try:
+            await slots.acquire()
+            async for item in iterator:
+                items.put_nowait((item, None))
+                await slots.acquire()
+            items.put_nowait((done, None))
+        except Exception as err:
+            items.put_nowait((done, err))
+
+    task = asyncio.ensure_future(produce())
+    try:
+        while True:
+            item, err = await items.get()
+            if err is not None:
+                raise err
+            if item is done:
+                return
+            slots.release()
+            yield item
+    finally:
+        task.cancel()
+
+
 def generate_instance_yaml_example(path=None):
     filename = 'instance_example.yaml'
     if path is not None:
@@ -6,38 +6,47 @@ from yandex_cloud_client.base import YandexCloudObject
 
 
 class Response(YandexCloudObject):
-    """This object represents a response from Yandex.Cloud API."""
+    """This object represents a response from Yandex.Cloud API.
+
+    The parsed payload is kept as is (not copied), the result is payload['result']
+    if it is set, otherwise the payload itself. Error fields are computed on access,
+    so they cost nothing for successful responses.
+
+    """
+
+    __slots__ = ('data', 'client')
 
     def __init__(self,
                  data: dict,
-                 result=None,
-                 error=None,
-                 error_description=None,
                  client=None,
                  **kwargs):
 
         super().handle_unknown_kwargs(self, **kwargs)
 
         self.data = data
-        self._result = result
-        self._error = error
-        self.error_description = error_description
-
         self.client = client
 
     @property
-    def error(self) -> str:
-        return f'{self._error}: {self.error_description if self.error_description else ""}'
+    def result(self) -> dict:
+        result = self.data.get('result')
+        return self.data if result is None else result
 
     @property
-    def result(self) -> dict:
-        return self.data if self._result is None else self._result
+    def error_code(self):
+        from yandex_cloud_client.utils.request import RpcError
+        return self.data.get('error') or RpcError(self.data.get('code', 2))
+
+    @property
+    def error_description(self) -> str:
+        return self.data.get('error_description') or self.data.get('message')
+
+    @property
+    def error(self) -> str:
+        return f'{self.error_code}: {self.error_description if self.error_description else ""}'
 
     @classmethod
     def de_json(cls, data: dict, client):
-        if not data:
+        if data is None:
             return None
 
-        data = super(Response, cls).de_json(data, client)
-        data['data'] = data.copy()
-        return cls(client=client, **data)
+        return cls(data, client=client)
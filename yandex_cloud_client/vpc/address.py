@@ -4,7 +4,7 @@
 import logging
 
 from yandex_cloud_client.base import YandexCloudObject
-from yandex_cloud_client.utils.helpers import universal_obj_hook
+from yandex_cloud_client.utils.fields import Field
 
 logger = logging.getLogger(__name__)
 
@@ -12,6 +12,13 @@ logger = logging.getLogger(__name__)
 class OneToOneNat(YandexCloudObject):
     """This object represents a one-to-one NAT address."""
 
+    __slots__ = ('address', 'ip_version', 'client')
+    _id_fields = ('address', 'ip_version')
+    _field_table = (
+        Field('address'),
+        Field('ip_version'),
+    )
+
     def __init__(self,
                  address=None,
                  ip_version=None,
@@ -24,31 +31,18 @@ class OneToOneNat(YandexCloudObject):
         self.ip_version = ip_version
 
         self.client = client
-        self._id_attrs = (self.address, self.ip_version)
-
-    @classmethod
-    def de_json(cls, data: dict, client):
-        if not data:
-            return None
-
-        data = super(OneToOneNat, cls).de_json(data, client)
-        return cls(client=client, **data)
-
-    @classmethod
-    def de_list(cls, data: list, client):
-        if not data:
-            return []
-
-        nats = list()
-        for nat in data:
-            nats.append(cls.de_json(nat, client))
-
-        return nats
 
 
 class Address(YandexCloudObject):
     """This object represents a base network address."""
 
+    __slots__ = ('address', 'one_to_one_nat', 'client')
+    _id_fields = ('address',)
+    _field_table = (
+        Field('address'),
+        Field('one_to_one_nat', nested='OneToOneNat'),
+    )
+
     def __init__(self,
                  address=None,
                  one_to_one_nat=None,
@@ -61,24 +55,3 @@ class Address(YandexCloudObject):
         self.one_to_one_nat = one_to_one_nat
 
         self.client = client
-        self._id_attrs = (self.address,)
-
-    @classmethod
-    def de_json(cls, data: dict, client):
-        if not data:
-            return None
-
-        data = super(Address, cls).de_json(data, client)
-        data['one_to_one_nat'] = OneToOneNat.de_json(universal_obj_hook(data.get('one_to_one_nat')), client)
-        return cls(client=client, **data)
-
-    @classmethod
-    def de_list(cls, data: list, client):
-        if not data:
-            return []
-
-        addresses = list()
-        for address in data:
-            addresses.append(cls.de_json(address, client))
-
-        return addresses
@@ -4,8 +4,8 @@
 
 import logging
 
-from yandex_cloud_client.utils.helpers import universal_obj_hook
 from yandex_cloud_client.base import YandexCloudObject
+from yandex_cloud_client.utils.fields import Field
 from yandex_cloud_client.vpc.address import Address
 
 logger = logging.getLogger(__name__)
@@ -14,6 +14,16 @@ logger = logging.getLogger(__name__)
 class NetworkInterface(YandexCloudObject):
     """This object represents a network interfaces of instance."""
 
+    __slots__ = ('index', 'mac_address', 'subnet_id', 'primary_v4_address', 'primary_v6_address', 'client')
+    _id_fields = ('index', 'mac_address')
+    _field_table = (
+        Field('index'),
+        Field('mac_address'),
+        Field('subnet_id'),
+        Field('primary_v4_address', nested=Address),
+        Field('primary_v6_address', nested=Address),
+    )
+
     def __init__(self,
                  index=None,
                  mac_address=None,
@@ -32,25 +42,3 @@ class NetworkInterface(YandexCloudObject):
         self.primary_v6_address = primary_v6_address
 
         self.client = client
-        self._id_attrs = (self.index, self.mac_address,)
-
-    @classmethod
-    def de_json(cls, data: dict, client):
-        if not data:
-            return None
-
-        data = super(NetworkInterface, cls).de_json(data, client)
-        data['primary_v4_address'] = Address.de_json(universal_obj_hook(data.get('primary_v4_address')), client)
-        data['primary_v6_address'] = Address.de_json(universal_obj_hook(data.get('primary_v6_address')), client)
-        return cls(client=client, **data)
-
-    @classmethod
-    def de_list(cls, data: list, client):
-        if not data:
-            return []
-
-        interfaces = list()
-        for interface in data:
-            interfaces.append(cls.de_json(interface, client))
-
-        return interfaces
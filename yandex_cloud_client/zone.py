@@ -3,11 +3,20 @@
 """This module contains Zone class."""
 
 from yandex_cloud_client.base import YandexCloudObject
+from yandex_cloud_client.utils.fields import Field
 
 
 class Zone(YandexCloudObject):
     """This object represents the availability zone."""
 
+    __slots__ = ('id', 'region_id', 'status', 'client')
+    _id_fields = ('id', 'region_id', 'status')
+    _field_table = (
+        Field('id'),
+        Field('region_id'),
+        Field('status'),
+    )
+
     def __init__(self,
                  id=None,
                  region_id=None,
@@ -22,24 +31,3 @@ class Zone(YandexCloudObject):
         self.status = status
 
         self.client = client
-        self._id_attrs = (self.id, self.region_id, self.status)
-
-
-    @classmethod
-    def de_json(cls, data: dict, client):
-        if not data:
-            return None
-
-        data = super(Zone, cls).de_json(data, client)
-        return cls(client=client, **data)
-
-    @classmethod
-    def de_list(cls, data: list, client):
-        if not data:
-            return []
-
-        zones = list()
-        for zone in data:
-            zones.append(cls.de_json(zone, client))
-
-        return zones